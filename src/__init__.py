@@ -1,8 +1,16 @@
 # This file can be empty, it's just to make the src directory a Python package
 
 """GitHub Code Reviewer package."""
-from github import Auth
-from .reviewer import CodeReviewer
+
+from typing import Any
 
 __version__ = '0.1.0'
 __all__ = ['CodeReviewer']
+
+
+def __getattr__(name: str) -> Any:
+    # Defer the PyGithub import until CodeReviewer is actually used
+    if name == 'CodeReviewer':
+        from .reviewer import CodeReviewer
+        return CodeReviewer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
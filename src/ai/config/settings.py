@@ -1,12 +1,112 @@
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, asdict
+from typing import Optional, List, Dict, Any, Mapping, Tuple
+from dataclasses import dataclass, field, fields
+import copy
+import glob
+import hashlib
+import json
 import os
-import yaml
 
-from .validator import ConfigValidator
+from .validator import get_validator
 
 
-@dataclass
+def _yaml_loader() -> Any:
+    """Get the LibYAML loader when available, else the pure-Python one."""
+    import yaml
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+# Parsed YAML keyed by (path, mtime_ns, size) so edits invalidate the entry
+_YAML_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+def _load_yaml(path: str) -> Dict[str, Any]:
+    """Load a YAML file, reusing the parsed result while it is unchanged."""
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    data = _YAML_CACHE.get(key)
+    if data is None:
+        if os.getenv('AI_CONFIG_CACHE') == '1':
+            data = _load_yaml_with_sidecar(path)
+        else:
+            import yaml
+            # Binary mode lets the parser decode (and detect BOMs) itself
+            with open(path, 'rb') as f:
+                data = yaml.load(f, Loader=_yaml_loader())
+        _YAML_CACHE[key] = data
+
+    # Hand out a copy so callers can't mutate the cached entry
+    return copy.deepcopy(data)
+
+
+def _load_yaml_with_sidecar(path: str) -> Dict[str, Any]:
+    """Load a YAML file through a JSON sidecar keyed by the file's hash.
+
+    The sidecar lives next to the YAML file as ``{path}.{hash}.cache.json``.
+    Only used when ``AI_CONFIG_CACHE=1`` so edits during development are
+    always picked up from the YAML source.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.md5(raw).hexdigest()[:16]
+    sidecar = f"{path}.{digest}.cache.json"
+
+    try:
+        with open(sidecar, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    import yaml
+    data = yaml.load(raw, Loader=_yaml_loader())
+
+    # Only cache data that survives a JSON round trip unchanged; non-string
+    # keys or dates would otherwise load differently from the sidecar
+    try:
+        dumped = json.dumps(data)
+    except (TypeError, ValueError):
+        return data
+    if json.loads(dumped) != data:
+        return data
+
+    # Best effort: a read-only config directory just means no sidecar
+    tmp_path = f"{sidecar}.{os.getpid()}.tmp"
+    try:
+        for stale in glob.glob(f"{glob.escape(path)}.*.cache.json"):
+            if stale != sidecar:
+                os.remove(stale)
+        with open(tmp_path, 'w') as f:
+            f.write(dumped)
+        os.replace(tmp_path, sidecar)
+    except OSError:
+        pass
+    finally:
+        if os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    return data
+
+
+def _csv(env: Mapping[str, str], key: str) -> Optional[List[str]]:
+    """Split a comma-separated env var, or None when unset/empty."""
+    value = env.get(key)
+    return value.split(',') if value else None
+
+
+def _shallow_dict(obj: Any) -> Dict[str, Any]:
+    """Convert a flat config dataclass to a dict without asdict's deepcopy."""
+    result = {}
+    for f in fields(obj):
+        value = getattr(obj, f.name)
+        if isinstance(value, (list, dict)):
+            value = value.copy()
+        result[f.name] = value
+    return result
+
+
+@dataclass(slots=True)
 class AIConfig:
     """AI provider configuration."""
     provider: str = "anthropic"
@@ -15,7 +115,7 @@ class AIConfig:
     max_tokens: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GitHubConfig:
     """GitHub configuration."""
     token: Optional[str] = None
@@ -26,7 +126,7 @@ class GitHubConfig:
     ignore_paths: List[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewConfig:
     """Review configuration."""
     type: str = "full"
@@ -38,98 +138,111 @@ class ReviewConfig:
     rules: Dict[str, Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration."""
     ai: AIConfig
     github: GitHubConfig
     review: ReviewConfig
+    # Set by the loaders, which already ran the data through the validator
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
 
     @classmethod
     def from_file(cls, path: str = "config/default_config.yml") -> 'Config':
         """Load configuration from a YAML file."""
-        validator = ConfigValidator()
+        validator = get_validator()
 
         if not os.path.exists(path):
             # Generate example config if file doesn't exist
             config_data = validator.generate_example_config()
         else:
-            with open(path, 'r') as f:
-                config_data = yaml.safe_load(f)
+            config_data = _load_yaml(path)
 
         # Validate and apply defaults
         validated_config = validator.validate_with_defaults(config_data)
 
-        return cls(
+        result = cls(
             ai=AIConfig(**validated_config.get('ai', {})),
             github=GitHubConfig(**validated_config.get('github', {})),
             review=ReviewConfig(**validated_config.get('review', {}))
         )
+        result._validated = True
+        return result
 
     @classmethod
     def from_env(cls) -> 'Config':
         """Load configuration from environment variables."""
+        env = os.environ
+        max_tokens = env.get('AI_MAX_TOKENS')
+        max_files = env.get('REVIEW_MAX_FILES')
+
         config = {
             'ai': {
-                'provider': os.getenv('AI_PROVIDER', 'anthropic'),
-                'model': os.getenv('AI_MODEL', 'claude-3-sonnet-20240229'),
-                'temperature': float(os.getenv('AI_TEMPERATURE', '0.7')),
-                'max_tokens': int(os.getenv('AI_MAX_TOKENS')) if os.getenv('AI_MAX_TOKENS') else None
+                'provider': env.get('AI_PROVIDER', 'anthropic'),
+                'model': env.get('AI_MODEL', 'claude-3-sonnet-20240229'),
+                'temperature': float(env.get('AI_TEMPERATURE', '0.7')),
+                'max_tokens': int(max_tokens) if max_tokens else None
             },
             'github': {
-                'token': os.getenv('GITHUB_TOKEN'),
-                'auto_approve': os.getenv('GITHUB_AUTO_APPROVE', '').lower() == 'true',
-                'comment_on_approval': os.getenv('GITHUB_COMMENT_ON_APPROVAL', '').lower() == 'true',
-                'request_changes_on_errors': os.getenv('GITHUB_REQUEST_CHANGES_ON_ERRORS', '').lower() == 'true',
-                'ignore_files': os.getenv('GITHUB_IGNORE_FILES', '').split(',') if os.getenv('GITHUB_IGNORE_FILES') else None,
-                'ignore_paths': os.getenv('GITHUB_IGNORE_PATHS', '').split(',') if os.getenv('GITHUB_IGNORE_PATHS') else None
+                'token': env.get('GITHUB_TOKEN'),
+                'auto_approve': env.get('GITHUB_AUTO_APPROVE', '').lower() == 'true',
+                'comment_on_approval': env.get('GITHUB_COMMENT_ON_APPROVAL', '').lower() == 'true',
+                'request_changes_on_errors': env.get('GITHUB_REQUEST_CHANGES_ON_ERRORS', '').lower() == 'true',
+                'ignore_files': _csv(env, 'GITHUB_IGNORE_FILES'),
+                'ignore_paths': _csv(env, 'GITHUB_IGNORE_PATHS')
             },
             'review': {
-                'type': os.getenv('REVIEW_TYPE', 'full'),
-                'max_files': int(os.getenv('REVIEW_MAX_FILES')) if os.getenv('REVIEW_MAX_FILES') else None,
-                'max_comments': int(os.getenv('REVIEW_MAX_COMMENTS', '50')),
-                'min_severity': os.getenv('REVIEW_MIN_SEVERITY', 'suggestion'),
-                'focus_areas': os.getenv('REVIEW_FOCUS_AREAS', '').split(',') if os.getenv('REVIEW_FOCUS_AREAS') else None,
-                'ignore_patterns': os.getenv('REVIEW_IGNORE_PATTERNS', '').split(',') if os.getenv('REVIEW_IGNORE_PATTERNS') else None
+                'type': env.get('REVIEW_TYPE', 'full'),
+                'max_files': int(max_files) if max_files else None,
+                'max_comments': int(env.get('REVIEW_MAX_COMMENTS', '50')),
+                'min_severity': env.get('REVIEW_MIN_SEVERITY', 'suggestion'),
+                'focus_areas': _csv(env, 'REVIEW_FOCUS_AREAS'),
+                'ignore_patterns': _csv(env, 'REVIEW_IGNORE_PATTERNS')
             }
         }
 
         # Validate configuration
-        validator = ConfigValidator()
+        validator = get_validator()
         validated_config = validator.validate_with_defaults(config)
 
-        return cls(
+        result = cls(
             ai=AIConfig(**validated_config['ai']),
             github=GitHubConfig(**validated_config['github']),
             review=ReviewConfig(**validated_config['review'])
         )
+        result._validated = True
+        return result
 
     @classmethod
     def default(cls) -> 'Config':
         """Create default configuration."""
-        validator = ConfigValidator()
+        validator = get_validator()
         config_data = validator.generate_example_config()
-        return cls(
+        result = cls(
             ai=AIConfig(**config_data['ai']),
             github=GitHubConfig(**config_data['github']),
             review=ReviewConfig(**config_data['review'])
         )
+        result._validated = True
+        return result
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
         return {
-            'ai': asdict(self.ai),
-            'github': asdict(self.github),
-            'review': asdict(self.review)
+            'ai': _shallow_dict(self.ai),
+            'github': _shallow_dict(self.github),
+            'review': _shallow_dict(self.review)
         }
 
     def save(self, path: str) -> None:
         """Save configuration to a file."""
         config_data = self.to_dict()
 
-        # Validate before saving
-        validator = ConfigValidator()
-        validator.validate(config_data)
+        # Validate before saving, unless a loader already did
+        if not self._validated:
+            validator = get_validator()
+            validator.validate(config_data)
 
+        import yaml
         with open(path, 'w') as f:
             yaml.safe_dump(config_data, f, default_flow_style=False)
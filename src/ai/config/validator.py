@@ -1,7 +1,11 @@
+import copy
+import functools
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from pathlib import Path
-import jsonschema
+
+if TYPE_CHECKING:
+    import jsonschema
 
 
 class ConfigValidator:
@@ -15,18 +19,24 @@ class ConfigValidator:
         with open(schema_path) as f:
             self.schema = json.load(f)
 
+        import jsonschema
+
+        # Check the schema once up front instead of on every validate() call
+        validator_cls = jsonschema.validators.validator_for(self.schema)
+        validator_cls.check_schema(self.schema)
+        self._validator = validator_cls(self.schema)
+
+        # The schema never changes, so build the example config only once
+        self._example_template = self._generate_from_schema(self.schema)
+
     def validate(self, config: Dict[str, Any]) -> List[str]:
         """
         Validate configuration against schema.
         Returns a list of validation errors, empty if valid.
         """
-        try:
-            jsonschema.validate(instance=config, schema=self.schema)
-            return []
-        except jsonschema.exceptions.ValidationError as e:
-            return [self._format_error(e)]
-        except jsonschema.exceptions.SchemaError as e:
-            return [f"Schema error: {str(e)}"]
+        return [
+            self._format_error(e) for e in self._validator.iter_errors(config)
+        ]
 
     def validate_with_defaults(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Validate configuration and fill in defaults from schema."""
@@ -37,43 +47,55 @@ class ConfigValidator:
 
         return self._apply_defaults(config, self.schema)
 
-    def _format_error(self, error: jsonschema.exceptions.ValidationError) -> str:
+    def _format_error(self, error: 'jsonschema.exceptions.ValidationError') -> str:
         """Format a validation error message."""
         path = " -> ".join(str(p) for p in error.path)
         return f"At {path}: {error.message}"
 
     def _apply_defaults(self, config: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively apply defaults from schema to config."""
+        """Apply defaults from schema to config without mutating the input."""
         if not isinstance(config, dict) or not isinstance(schema, dict):
             return config
 
         result = config.copy()
-        properties = schema.get("properties", {})
-
-        for key, value_schema in properties.items():
-            if key not in result and "default" in value_schema:
-                result[key] = value_schema["default"]
-            elif key in result and "properties" in value_schema:
-                result[key] = self._apply_defaults(result[key], value_schema)
+        stack = [(result, schema)]
+        while stack:
+            node, node_schema = stack.pop()
+            for key, value_schema in node_schema.get("properties", {}).items():
+                if key not in node:
+                    if "default" in value_schema:
+                        # Schema is shared via get_validator(), so never alias defaults
+                        default = value_schema["default"]
+                        node[key] = copy.deepcopy(default) if isinstance(
+                            default, (dict, list)) else default
+                elif "properties" in value_schema and isinstance(node[key], dict):
+                    # Copy on descent so the caller's nested dicts stay untouched
+                    child = node[key].copy()
+                    node[key] = child
+                    stack.append((child, value_schema))
 
         return result
 
     def generate_example_config(self) -> Dict[str, Any]:
         """Generate an example configuration with all defaults."""
-        return self._generate_from_schema(self.schema)
+        return copy.deepcopy(self._example_template)
 
     def _generate_from_schema(self, schema: Dict[str, Any]) -> Any:
         """Recursively generate configuration from schema."""
         if "default" in schema:
-            return schema["default"]
+            return copy.deepcopy(schema["default"])
+
+        # "type" may be a single name or a list such as ["object", "null"]
+        schema_type = schema.get("type", "null")
+        types = schema_type if isinstance(schema_type, list) else [schema_type]
 
-        if schema.get("type") == "object" and "properties" in schema:
+        if "object" in types and "properties" in schema:
             return {
                 key: self._generate_from_schema(prop_schema)
                 for key, prop_schema in schema["properties"].items()
             }
 
-        if schema.get("type") == "array":
+        if "array" in types:
             return []
 
         type_defaults = {
@@ -84,4 +106,10 @@ class ConfigValidator:
             "null": None
         }
 
-        return type_defaults.get(schema.get("type", "null"), None)
+        return type_defaults.get(types[0], None)
+
+
+@functools.lru_cache(maxsize=4)
+def get_validator(schema_path: Optional[str] = None) -> ConfigValidator:
+    """Get a shared validator so the schema is only loaded once per path."""
+    return ConfigValidator(schema_path)
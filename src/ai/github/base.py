@@ -1,12 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, TYPE_CHECKING
 from dataclasses import dataclass
 from datetime import datetime
 
-from github import Github
-from github.PullRequest import PullRequest
-from github.Repository import Repository
-from github.File import File as GithubFile
+if TYPE_CHECKING:
+    from github.Repository import Repository
 
 
 @dataclass
@@ -22,6 +20,7 @@ class PullRequestInfo:
     updated_at: datetime
     files_changed: List[str]
     diff: Optional[str] = None
+    file_patches: Optional[Dict[str, str]] = None  # Per-file unified diff hunks
 
 
 @dataclass
@@ -38,27 +37,28 @@ class GitHubProvider(ABC):
     """Base class for GitHub integration."""
 
     def __init__(self, token: str):
+        from github import Github
         self.client = Github(token)
 
     @abstractmethod
-    async def get_repository(self, repo_name: str) -> Repository:
+    async def get_repository(self, repo_name: str) -> 'Repository':
         """Get a GitHub repository."""
         pass
 
     @abstractmethod
-    async def get_pull_request(self, repo: Repository, pr_number: int) -> PullRequestInfo:
+    async def get_pull_request(self, repo: 'Repository', pr_number: int) -> PullRequestInfo:
         """Get information about a pull request."""
         pass
 
     @abstractmethod
-    async def get_file_content(self, repo: Repository, path: str, ref: str) -> str:
+    async def get_file_content(self, repo: 'Repository', path: str, ref: str) -> str:
         """Get the content of a file from the repository."""
         pass
 
     @abstractmethod
     async def create_review_comment(
         self,
-        repo: Repository,
+        repo: 'Repository',
         pr_number: int,
         comment: ReviewComment
     ) -> None:
@@ -68,7 +68,7 @@ class GitHubProvider(ABC):
     @abstractmethod
     async def create_review(
         self,
-        repo: Repository,
+        repo: 'Repository',
         pr_number: int,
         comments: List[ReviewComment],
         body: str,
@@ -80,7 +80,7 @@ class GitHubProvider(ABC):
     @abstractmethod
     async def get_commit_diff(
         self,
-        repo: Repository,
+        repo: 'Repository',
         base_sha: str,
         head_sha: str
     ) -> str:
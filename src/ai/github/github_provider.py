@@ -1,24 +1,78 @@
-from typing import List
-import base64
+from typing import Any, Dict, Hashable, List, Tuple, TYPE_CHECKING
+import asyncio
 from datetime import datetime
 
-from github.PullRequest import PullRequest
-from github.Repository import Repository
+if TYPE_CHECKING:
+    from github.PullRequest import PullRequest
+    from github.Repository import Repository
 
 from .base import GitHubProvider, PullRequestInfo, ReviewComment
 
+# Most recently used repositories/pull requests kept per provider; the
+# provider lives for the whole process, so the caches must stay bounded
+MAX_CACHED_OBJECTS = 32
+
+
+def _remember(cache: Dict[Hashable, Any], key: Hashable, value: Any) -> None:
+    """Store a value, evicting the least recently used entry when full."""
+    cache.pop(key, None)
+    cache[key] = value
+    if len(cache) > MAX_CACHED_OBJECTS:
+        del cache[next(iter(cache))]
+
 
 class GitHubAPIProvider(GitHubProvider):
-    """Implementation of the GitHub provider using the PyGithub library."""
+    """Implementation of the GitHub provider using the PyGithub library.
+
+    PyGithub is blocking, so every call that can hit the network runs in a
+    worker thread via ``asyncio.to_thread`` to keep the event loop free.
+    """
+
+    def __init__(self, token: str):
+        super().__init__(token)
+        # Each lookup is a REST round-trip, so reuse objects for the session
+        self._repo_cache: Dict[str, 'Repository'] = {}
+        self._pr_cache: Dict[Tuple[str, int], 'PullRequest'] = {}
 
-    async def get_repository(self, repo_name: str) -> Repository:
+    async def _fetch_pull(self, repo: 'Repository', pr_number: int) -> 'PullRequest':
+        """Fetch a pull request from the API and cache it."""
+        pr = await asyncio.to_thread(repo.get_pull, pr_number)
+        _remember(self._pr_cache, (repo.full_name, pr_number), pr)
+        return pr
+
+    async def _get_pull(self, repo: 'Repository', pr_number: int) -> 'PullRequest':
+        """Get a pull request, reusing the object from the latest fetch."""
+        key = (repo.full_name, pr_number)
+        pr = self._pr_cache.get(key)
+        if pr is None:
+            return await self._fetch_pull(repo, pr_number)
+        _remember(self._pr_cache, key, pr)
+        return pr
+
+    async def get_repository(self, repo_name: str) -> 'Repository':
         """Get a GitHub repository."""
-        return self.client.get_repo(repo_name)
+        repo = self._repo_cache.get(repo_name)
+        if repo is None:
+            repo = await asyncio.to_thread(self.client.get_repo, repo_name)
+        _remember(self._repo_cache, repo_name, repo)
+        return repo
 
-    async def get_pull_request(self, repo: Repository, pr_number: int) -> PullRequestInfo:
+    async def get_pull_request(self, repo: 'Repository', pr_number: int) -> PullRequestInfo:
         """Get information about a pull request."""
-        pr = repo.get_pull(pr_number)
-        files = [f.filename for f in pr.get_files()]
+        # Always refetched, so a re-review sees the current title, body and
+        # files; the comment/review calls that follow reuse this object
+        pr = await self._fetch_pull(repo, pr_number)
+        return await asyncio.to_thread(self._build_pull_request_info, pr)
+
+    def _build_pull_request_info(self, pr: 'PullRequest') -> PullRequestInfo:
+        """Collect pull request details (blocking: paginates the file list)."""
+        # Single pass over the paginated file list for names and patches
+        files = []
+        file_patches = {}
+        for f in pr.get_files():
+            files.append(f.filename)
+            if f.patch:
+                file_patches[f.filename] = f.patch
 
         return PullRequestInfo(
             number=pr.number,
@@ -30,33 +84,35 @@ class GitHubAPIProvider(GitHubProvider):
             created_at=pr.created_at,
             updated_at=pr.updated_at,
             files_changed=files,
-            diff=pr.get_diff() if hasattr(pr, 'get_diff') else None
+            diff=pr.get_diff() if hasattr(pr, 'get_diff') else None,
+            file_patches=file_patches
         )
 
-    async def get_file_content(self, repo: Repository, path: str, ref: str) -> str:
+    async def get_file_content(self, repo: 'Repository', path: str, ref: str) -> str:
         """Get the content of a file from the repository."""
         try:
-            content = repo.get_contents(path, ref=ref)
+            content = await asyncio.to_thread(repo.get_contents, path, ref=ref)
             if isinstance(content, list):
                 raise ValueError(f"Path '{path}' points to a directory")
 
-            # Decode content from base64
-            return base64.b64decode(content.content).decode('utf-8')
+            # PyGithub already base64-decodes (and caches) the payload
+            return content.decoded_content.decode('utf-8')
         except Exception as e:
             raise ValueError(f"Failed to get file content: {str(e)}")
 
     async def create_review_comment(
         self,
-        repo: Repository,
+        repo: 'Repository',
         pr_number: int,
         comment: ReviewComment
     ) -> None:
         """Create a review comment on a pull request."""
-        pr = repo.get_pull(pr_number)
+        pr = await self._get_pull(repo, pr_number)
 
         if comment.position is not None:
             # Create a comment on a specific line in the diff
-            pr.create_review_comment(
+            await asyncio.to_thread(
+                pr.create_review_comment,
                 body=comment.body,
                 commit_id=comment.commit_id,
                 path=comment.path,
@@ -64,18 +120,18 @@ class GitHubAPIProvider(GitHubProvider):
             )
         else:
             # Create a comment on the pull request itself
-            pr.create_issue_comment(comment.body)
+            await asyncio.to_thread(pr.create_issue_comment, comment.body)
 
     async def create_review(
         self,
-        repo: Repository,
+        repo: 'Repository',
         pr_number: int,
         comments: List[ReviewComment],
         body: str,
         event: str = "COMMENT"
     ) -> None:
         """Create a complete review on a pull request."""
-        pr = repo.get_pull(pr_number)
+        pr = await self._get_pull(repo, pr_number)
 
         # Convert ReviewComment objects to GitHub review comment format
         review_comments = [
@@ -89,8 +145,14 @@ class GitHubAPIProvider(GitHubProvider):
             if comment.position is not None or comment.line is not None
         ]
 
+        # A plain comment with nothing anchored is just a PR conversation comment
+        if not review_comments and event == "COMMENT":
+            await asyncio.to_thread(pr.create_issue_comment, body)
+            return
+
         # Create the review
-        pr.create_review(
+        await asyncio.to_thread(
+            pr.create_review,
             body=body,
             event=event,
             comments=review_comments
@@ -98,10 +160,10 @@ class GitHubAPIProvider(GitHubProvider):
 
     async def get_commit_diff(
         self,
-        repo: Repository,
+        repo: 'Repository',
         base_sha: str,
         head_sha: str
     ) -> str:
         """Get the diff between two commits."""
-        comparison = repo.compare(base_sha, head_sha)
+        comparison = await asyncio.to_thread(repo.compare, base_sha, head_sha)
         return comparison.diff
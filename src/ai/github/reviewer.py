@@ -1,5 +1,7 @@
 from typing import Optional, Dict, List
+from collections import Counter
 from datetime import datetime
+import asyncio
 
 from ..reviewer import Reviewer
 from ..models.request import ReviewType, CodeContext, ReviewSettings
@@ -7,6 +9,44 @@ from ..models.response import AIResponse, ReviewComment as AIReviewComment
 from .base import GitHubProvider, ReviewComment
 from ..exceptions import ReviewError
 
+# Upper bound on simultaneous file-content requests to the GitHub API
+MAX_CONCURRENT_FETCHES = 20
+
+SEVERITY_ICONS = {
+    "error": "🔴",
+    "warning": "⚠️",
+    "suggestion": "💡",
+    "praise": "✨"
+}
+
+
+def split_diff_by_file(diff: str) -> Dict[str, str]:
+    """Split a unified PR diff into per-file hunks keyed by file path."""
+    per_file = {}
+    for section in ('\n' + diff).split('\ndiff --git ')[1:]:
+        git_line, _, rest = section.partition('\n')
+        # Extended headers (index, mode, rename, similarity) run up to the
+        # first hunk; prefer the post-image path, since deleted files only
+        # have the '--- a/' one
+        path = None
+        for line in rest.split('\n@@', 1)[0].split('\n'):
+            if line.startswith('+++ b/'):
+                path = line[6:]
+                break
+            if line.startswith('rename to '):
+                path = line[10:]
+                break
+            if line.startswith('--- a/'):
+                path = line[6:]
+        if path is None:
+            # No content hunks (e.g. binary or mode-only change): use the
+            # post-image path from the 'diff --git a/X b/Y' line
+            _, found, path = git_line.rpartition(' b/')
+            if not found:
+                continue
+        per_file[path] = 'diff --git ' + section
+    return per_file
+
 
 class GitHubReviewer:
     """GitHub-specific code reviewer."""
@@ -27,47 +67,83 @@ class GitHubReviewer:
         pr_number: int,
         review_type: Optional[ReviewType] = None,
         settings: Optional[ReviewSettings] = None,
-        store_review: bool = True
+        store_review: bool = True,
+        max_concurrent: int = 5
     ) -> Dict[str, AIResponse]:
         """Review a GitHub pull request."""
         # Get repository and PR info
         repo = await self.github.get_repository(repo_name)
         pr_info = await self.github.get_pull_request(repo, pr_number)
 
-        # Get file contents and create reviews
-        reviews = {}
-        for file_path in pr_info.files_changed:
+        # Prefetch every file's content up front (bounded to stay under
+        # GitHub's secondary rate limits) so downloads overlap with reviews
+        fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+        async def fetch_one(file_path: str) -> str:
+            async with fetch_semaphore:
+                return await self.github.get_file_content(repo, file_path, pr_info.head_branch)
+
+        fetches = {
+            file_path: asyncio.ensure_future(fetch_one(file_path))
+            for file_path in pr_info.files_changed
+        }
+
+        # Send each file only its own hunks, not the whole PR diff
+        if pr_info.file_patches is not None:
+            file_diffs = pr_info.file_patches
+        elif pr_info.diff:
+            file_diffs = split_diff_by_file(pr_info.diff)
+        else:
+            file_diffs = {}
+
+        # Files are independent, so review them concurrently within a
+        # bound that keeps us under the AI provider's rate limits
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def review_one(file_path: str) -> AIResponse:
             try:
                 # Get file content
-                content = await self.github.get_file_content(repo, file_path, pr_info.head_branch)
-
-                # Create review request
-                context = CodeContext(
-                    file_path=file_path,
-                    content=content,
-                    diff=pr_info.diff,
-                    repository=repo_name,
-                    base_branch=pr_info.base_branch,
-                    commit_hash=None,  # We'll add this when needed
-                    author=pr_info.author,
-                    changed_files=pr_info.files_changed
-                )
-
-                # Generate review
-                review, _ = await self.reviewer.review_file(
-                    file_path,
-                    content,
-                    review_type or self.default_review_type,
-                    settings,
-                    store_review,
-                    **context.__dict__
-                )
-
-                reviews[file_path] = review
+                content = await fetches[file_path]
+
+                async with semaphore:
+                    # Create review request
+                    context = CodeContext(
+                        file_path=file_path,
+                        content=content,
+                        diff=file_diffs.get(file_path),
+                        repository=repo_name,
+                        base_branch=pr_info.base_branch,
+                        commit_hash=None,  # We'll add this when needed
+                        author=pr_info.author,
+                        changed_files=pr_info.files_changed
+                    )
+
+                    # Generate review
+                    review, _ = await self.reviewer.review_file(
+                        file_path,
+                        content,
+                        review_type or self.default_review_type,
+                        settings,
+                        store_review,
+                        context=context
+                    )
+                    return review
 
             except Exception as e:
                 raise ReviewError(f"Failed to review {file_path}: {str(e)}")
 
+        # Let every review finish before reporting, so no task is left orphaned
+        results = await asyncio.gather(
+            *(review_one(file_path) for file_path in pr_info.files_changed),
+            return_exceptions=True
+        )
+
+        reviews = {}
+        for file_path, result in zip(pr_info.files_changed, results):
+            if isinstance(result, BaseException):
+                raise result
+            reviews[file_path] = result
+
         return reviews
 
     async def submit_review(
@@ -78,28 +154,41 @@ class GitHubReviewer:
         review_type: ReviewType
     ) -> None:
         """Submit reviews as GitHub comments."""
-        repo = await self.github.get_repository(repo_name)
-
-        # Convert AI review comments to GitHub review comments
-        github_comments = []
-        for file_path, review in reviews.items():
-            for comment in review.comments:
-                github_comments.append(
-                    ReviewComment(
-                        body=self._format_comment(comment),
-                        path=file_path,
-                        line=comment.line_number,
-                        position=None  # We'll need to calculate this from the diff
+        # Start the repository lookup now so it overlaps the formatting below
+        repo_task = asyncio.ensure_future(self.github.get_repository(repo_name))
+
+        try:
+            # One pass over every review builds the GitHub comments, the
+            # severity tally and the per-file summary sections together
+            github_comments = []
+            severity_counts = Counter()
+            file_summaries = []
+            for file_path, review in reviews.items():
+                for comment in review.comments:
+                    severity_counts[comment.severity] += 1
+                    github_comments.append(
+                        ReviewComment(
+                            body=self._format_comment(comment),
+                            path=file_path,
+                            line=comment.line_number,
+                            position=None  # We'll need to calculate this from the diff
+                        )
                     )
-                )
+                file_summaries.append(f"\n## {file_path}\n{review.summary}\n")
 
-        # Create summary body
-        summary = self._create_summary(reviews, review_type)
+            # Create summary body
+            summary = self._create_summary(
+                review_type, len(reviews), severity_counts, file_summaries)
 
-        # Determine review event based on critical issues
-        event = self._determine_review_event(reviews)
+            # Determine review event based on critical issues
+            event = self._determine_review_event(severity_counts)
+        except BaseException:
+            # Don't leave the lookup running unawaited when formatting fails
+            repo_task.cancel()
+            raise
 
         # Submit the review
+        repo = await repo_task
         await self.github.create_review(
             repo,
             pr_number,
@@ -110,63 +199,47 @@ class GitHubReviewer:
 
     def _format_comment(self, comment: AIReviewComment) -> str:
         """Format an AI review comment for GitHub."""
-        severity_icons = {
-            "error": "🔴",
-            "warning": "⚠️",
-            "suggestion": "💡",
-            "praise": "✨"
-        }
-
-        formatted = f"{severity_icons.get(comment.severity, '•')} **{comment.category.title()}**\n\n"
-        formatted += comment.content
+        parts = [
+            f"{SEVERITY_ICONS.get(comment.severity, '•')} **{comment.category.title()}**\n\n",
+            comment.content
+        ]
 
         if comment.suggested_fix:
-            formatted += f"\n\n**Suggested Fix:**\n```\n{comment.suggested_fix}\n```"
+            parts.append(f"\n\n**Suggested Fix:**\n```\n{comment.suggested_fix}\n```")
 
-        return formatted
+        return "".join(parts)
 
-    def _create_summary(self, reviews: Dict[str, AIResponse], review_type: ReviewType) -> str:
+    def _create_summary(
+        self,
+        review_type: ReviewType,
+        total_files: int,
+        severity_counts: Counter,
+        file_summaries: List[str]
+    ) -> str:
         """Create a summary of all reviews."""
-        total_files = len(reviews)
-        total_comments = sum(len(review.comments)
-                             for review in reviews.values())
-        errors = sum(
-            len(review.get_comments_by_severity("error"))
-            for review in reviews.values()
-        )
-        warnings = sum(
-            len(review.get_comments_by_severity("warning"))
-            for review in reviews.values()
-        )
-
-        summary = f"# AI Code Review ({review_type.value})\n\n"
-        summary += f"Reviewed {total_files} files and found:\n"
-        summary += f"- 🔴 {errors} critical issues\n"
-        summary += f"- ⚠️ {warnings} warnings\n"
-        summary += f"- 💭 {total_comments - errors - warnings} suggestions\n\n"
+        total_comments = sum(severity_counts.values())
+        errors = severity_counts["error"]
+        warnings = severity_counts["warning"]
+
+        parts = [
+            f"# AI Code Review ({review_type.value})\n\n",
+            f"Reviewed {total_files} files and found:\n",
+            f"- 🔴 {errors} critical issues\n",
+            f"- ⚠️ {warnings} warnings\n",
+            f"- 💭 {total_comments - errors - warnings} suggestions\n\n"
+        ]
 
         # Add individual file summaries
-        for file_path, review in reviews.items():
-            summary += f"\n## {file_path}\n{review.summary}\n"
+        parts.extend(file_summaries)
 
-        return summary
+        return "".join(parts)
 
-    def _determine_review_event(self, reviews: Dict[str, AIResponse]) -> str:
+    def _determine_review_event(self, severity_counts: Counter) -> str:
         """Determine the review event based on the findings."""
-        total_errors = sum(
-            len(review.get_comments_by_severity("error"))
-            for review in reviews.values()
-        )
-
-        if total_errors > 0:
+        if severity_counts["error"] > 0:
             return "REQUEST_CHANGES"
 
-        total_warnings = sum(
-            len(review.get_comments_by_severity("warning"))
-            for review in reviews.values()
-        )
-
-        if total_warnings > 0:
+        if severity_counts["warning"] > 0:
             return "COMMENT"
 
         return "APPROVE"
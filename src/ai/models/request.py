@@ -1,6 +1,18 @@
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Literal
 from enum import Enum
+import re
+
+# One case-insensitive alternation per check so the content is scanned in a
+# single pass without allocating a lowercased copy of it
+SECURITY_SENSITIVE_PATTERN = re.compile('|'.join([
+    'password', 'token', 'secret', 'auth', 'crypt',
+    'security', 'permission', 'access', 'private'
+]), re.IGNORECASE)
+PERFORMANCE_CRITICAL_PATTERN = re.compile('|'.join([
+    'loop', 'query', 'algorithm', 'cache', 'performance',
+    'optimization', 'batch', 'concurrent', 'thread'
+]), re.IGNORECASE)
 
 
 class ReviewType(str, Enum):
@@ -14,7 +26,7 @@ class ReviewType(str, Enum):
     QUICK = "quick"  # Quick overview of critical issues
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeContext:
     """Context information about the code being reviewed."""
     file_path: str
@@ -29,7 +41,7 @@ class CodeContext:
     changed_files: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewSettings:
     """Settings for the code review."""
     max_comments: Optional[int] = None  # Maximum number of comments to return
@@ -39,7 +51,7 @@ class ReviewSettings:
     custom_rules: Optional[Dict[str, any]] = None  # Custom review rules
 
 
-@dataclass
+@dataclass(slots=True)
 class AIRequest:
     """Request model for AI code review."""
     code_context: CodeContext
@@ -51,32 +63,23 @@ class AIRequest:
 
     def validate(self) -> bool:
         """Validate the request parameters."""
-        if not self.code_context.content:
+        # Cheapest checks first
+        if not isinstance(self.review_type, ReviewType):
             return False
-        if not self.code_context.file_path:
+        if not 0.0 <= self.temperature <= 1.0:
             return False
-        if self.temperature < 0 or self.temperature > 1:
+        if not self.code_context.file_path:
             return False
-        if not isinstance(self.review_type, ReviewType):
+        if not self.code_context.content:
             return False
         return True
 
     @property
     def is_security_sensitive(self) -> bool:
         """Check if the review involves security-sensitive code."""
-        sensitive_patterns = [
-            'password', 'token', 'secret', 'auth', 'crypt',
-            'security', 'permission', 'access', 'private'
-        ]
-        return any(pattern in self.code_context.content.lower()
-                   for pattern in sensitive_patterns)
+        return SECURITY_SENSITIVE_PATTERN.search(self.code_context.content) is not None
 
     @property
     def is_performance_critical(self) -> bool:
         """Check if the review involves performance-critical code."""
-        critical_patterns = [
-            'loop', 'query', 'algorithm', 'cache', 'performance',
-            'optimization', 'batch', 'concurrent', 'thread'
-        ]
-        return any(pattern in self.code_context.content.lower()
-                   for pattern in critical_patterns)
+        return PERFORMANCE_CRITICAL_PATTERN.search(self.code_context.content) is not None
@@ -1,9 +1,17 @@
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict
-from datetime import datetime
+from datetime import datetime, timezone
 
+# Most to least severe; reports list severities in this order
+SEVERITY_ORDER = ('error', 'warning', 'suggestion', 'praise')
+VALID_SEVERITIES = frozenset(SEVERITY_ORDER)
+VALID_CATEGORIES = frozenset({
+    'security', 'performance', 'style', 'logic', 'documentation', 'best_practices'
+})
 
-@dataclass
+
+@dataclass(slots=True)
 class ReviewComment:
     """Represents a single review comment."""
     line_number: Optional[int]
@@ -13,19 +21,26 @@ class ReviewComment:
     suggested_fix: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AIResponse:
     """Response model for AI code review."""
     comments: List[ReviewComment]
     summary: str
     score: Optional[float] = None  # Overall code quality score (0-1)
-    metadata: Dict[str, any] = None
-    timestamp: datetime = datetime.utcnow()
+    metadata: Dict[str, any] = field(default_factory=dict)
+    # Stamped per instance; a plain default would be frozen at import time
+    timestamp: datetime = field(
+        default_factory=lambda: datetime.now(timezone.utc))
 
     def get_comments_by_severity(self, severity: str) -> List[ReviewComment]:
         """Filter comments by severity level."""
         return [c for c in self.comments if c.severity == severity]
 
+    @property
+    def severity_counts(self) -> Counter:
+        """Number of comments per severity, counted in a single pass."""
+        return Counter(c.severity for c in self.comments)
+
     def get_comments_by_category(self, category: str) -> List[ReviewComment]:
         """Filter comments by category."""
         return [c for c in self.comments if c.category == category]
@@ -1,13 +1,15 @@
 from typing import Dict, Optional, List
 import json
-import re
-from anthropic import Anthropic
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 
 from .base import BaseProvider
 from ..models.request import AIRequest
-from ..models.response import AIResponse, ReviewComment
+from ..models.response import AIResponse, ReviewComment, VALID_SEVERITIES, VALID_CATEGORIES
 from ..exceptions import ProviderError, ReviewError
 
+_json_decoder = json.JSONDecoder()
+
 
 class AnthropicProvider(BaseProvider):
     """Anthropic Claude provider for code review."""
@@ -89,76 +91,9 @@ Be thorough but concise. Each comment should:
 
 For line-specific comments, always include the line_number. For general patterns or issues, use null for line_number."""
 
-    def __init__(self, api_key: str, **kwargs):
-        super().__init__(api_key, **kwargs)
-        self.client = Anthropic(api_key=api_key)
-        self.model = kwargs.get('model', self.DEFAULT_MODEL)
-        self.system_prompt = kwargs.get(
-            'system_prompt', self.DEFAULT_SYSTEM_PROMPT)
-
-    async def generate_review(self, request: AIRequest) -> AIResponse:
-        """Generate a code review using Claude."""
-        try:
-            if not request.validate():
-                raise ProviderError("Invalid request parameters")
-
-            prompt = self._build_review_prompt(request)
-
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=request.max_tokens or 4096,
-                temperature=request.temperature,
-                system=self.system_prompt,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            return self._parse_response(response.content)
-
-        except Exception as e:
-            raise ProviderError(f"Failed to generate review: {str(e)}")
-
-    def _build_review_prompt(self, request: AIRequest) -> str:
-        """Build the review prompt from the request."""
-        context = request.code_context
-
-        # Get specialized prompt based on review type
-        specialized_prompt = self._get_specialized_prompt(request)
-
-        prompt = f"""Please review the following code from file: {context.file_path}
-        
-Language: {context.language or 'Unknown'}
-Review Type: {request.review_type.value}
-{f'Author: {context.author}' if context.author else ''}
-{f'Commit: {context.commit_hash}' if context.commit_hash else ''}
-
-{specialized_prompt}
-
-Code to review:
-```
-{context.content}
-```
-"""
-        if context.diff:
-            prompt += f"\nChanges made:\n```\n{context.diff}\n```"
-
-        # Add review settings if present
-        if request.settings:
-            prompt += "\nReview Settings:"
-            if request.settings.max_comments:
-                prompt += f"\n- Maximum comments: {request.settings.max_comments}"
-            if request.settings.min_severity:
-                prompt += f"\n- Minimum severity: {request.settings.min_severity}"
-            if request.settings.focus_areas:
-                prompt += f"\n- Focus areas: {', '.join(request.settings.focus_areas)}"
-            if request.settings.ignore_patterns:
-                prompt += f"\n- Ignore patterns: {', '.join(request.settings.ignore_patterns)}"
-
-        return prompt
-
-    def _get_specialized_prompt(self, request: AIRequest) -> str:
-        """Get specialized prompt based on review type."""
-        prompts = {
-            "security": """Focus on security vulnerabilities and best practices:
+    # Review-type specific instructions; 'full' reviews use none
+    SPECIALIZED_PROMPTS = {
+        "security": """Focus on security vulnerabilities and best practices:
 - Identify potential security risks and vulnerabilities
 - Check for proper input validation and sanitization
 - Review authentication and authorization mechanisms
@@ -170,7 +105,7 @@ Pay special attention to:
 - Security configurations
 - Cryptographic implementations""",
 
-            "performance": """Focus on performance optimization and efficiency:
+        "performance": """Focus on performance optimization and efficiency:
 - Analyze algorithmic complexity and efficiency
 - Identify performance bottlenecks
 - Review resource usage patterns
@@ -182,7 +117,7 @@ Pay special attention to:
 - Query optimization
 - Concurrency issues""",
 
-            "maintainability": """Focus on code maintainability and quality:
+        "maintainability": """Focus on code maintainability and quality:
 - Evaluate code organization and structure
 - Check for proper design patterns usage
 - Review code modularity and reusability
@@ -194,7 +129,7 @@ Pay special attention to:
 - Test coverage
 - Code duplication""",
 
-            "style": """Focus on code style and formatting:
+        "style": """Focus on code style and formatting:
 - Check adherence to language style guides
 - Review naming conventions
 - Assess code formatting
@@ -206,7 +141,7 @@ Pay special attention to:
 - Comment quality
 - Language idioms""",
 
-            "documentation": """Focus on documentation quality:
+        "documentation": """Focus on documentation quality:
 - Review code comments and docstrings
 - Check API documentation
 - Assess usage examples
@@ -218,16 +153,107 @@ Pay special attention to:
 - Architecture documentation
 - Implementation notes""",
 
-            "quick": """Perform a quick review focusing on critical issues:
+        "quick": """Perform a quick review focusing on critical issues:
 - Identify major bugs or issues
 - Spot significant security vulnerabilities
 - Note obvious performance problems
 - Flag maintainability concerns
 Focus only on high-impact issues that require immediate attention."""
-        }
+    }
+
+    # Concurrent reviews share one pooled HTTP/2 client, so requests are
+    # multiplexed over kept-alive connections instead of new TLS handshakes
+    HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
 
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
+        # Pooled connections belong to the event loop that opened them, so
+        # the client lives as long as this provider and close() releases it
+        self.client = AsyncAnthropic(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(
+                http2=True, limits=self.HTTP_LIMITS)
+        )
+        self.model = kwargs.get('model', self.DEFAULT_MODEL)
+        self.system_prompt = kwargs.get(
+            'system_prompt', self.DEFAULT_SYSTEM_PROMPT)
+
+    async def generate_review(self, request: AIRequest) -> AIResponse:
+        """Generate a code review using Claude."""
+        try:
+            if not request.validate():
+                raise ProviderError("Invalid request parameters")
+
+            prompt = self._build_review_prompt(request)
+
+            # Stream the reply so text is collected as it is generated rather
+            # than held behind one long-lived request for the whole response
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=request.max_tokens or 4096,
+                temperature=request.temperature,
+                system=self.system_prompt,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                chunks = [text async for text in stream.text_stream]
+
+            return self._parse_response("".join(chunks))
+
+        except Exception as e:
+            raise ProviderError(f"Failed to generate review: {str(e)}")
+
+    def _build_review_prompt(self, request: AIRequest) -> str:
+        """Build the review prompt from the request."""
+        context = request.code_context
+
+        # Get specialized prompt based on review type
+        specialized_prompt = self._get_specialized_prompt(request)
+
+        lines = [
+            f"Please review the following code from file: {context.file_path}",
+            "",
+            f"Language: {context.language or 'Unknown'}",
+            f"Review Type: {request.review_type.value}",
+        ]
+        if context.author:
+            lines.append(f"Author: {context.author}")
+        if context.commit_hash:
+            lines.append(f"Commit: {context.commit_hash}")
+        lines += [
+            "",
+            specialized_prompt,
+            "",
+            "Code to review:",
+            "```",
+            context.content,
+            "```",
+        ]
+
+        if context.diff:
+            lines += ["", "Changes made:", "```", context.diff, "```"]
+
+        # Add review settings if present
+        settings = request.settings
+        if settings:
+            setting_lines = []
+            if settings.max_comments:
+                setting_lines.append(f"- Maximum comments: {settings.max_comments}")
+            if settings.min_severity:
+                setting_lines.append(f"- Minimum severity: {settings.min_severity}")
+            if settings.focus_areas:
+                setting_lines.append(f"- Focus areas: {', '.join(settings.focus_areas)}")
+            if settings.ignore_patterns:
+                setting_lines.append(f"- Ignore patterns: {', '.join(settings.ignore_patterns)}")
+            if setting_lines:
+                lines += ["", "Review Settings:"] + setting_lines
+
+        return "\n".join(lines)
+
+    def _get_specialized_prompt(self, request: AIRequest) -> str:
+        """Get specialized prompt based on review type."""
         # Get specialized prompt or use default for 'full' review
-        specialized_prompt = prompts.get(request.review_type.value, "")
+        specialized_prompt = self.SPECIALIZED_PROMPTS.get(
+            request.review_type.value, "")
 
         # Add security-focused instructions if code is security-sensitive
         if request.is_security_sensitive and request.review_type.value != "security":
@@ -242,13 +268,13 @@ Focus only on high-impact issues that require immediate attention."""
     def _parse_response(self, content: str) -> AIResponse:
         """Parse Claude's response into structured format."""
         try:
-            # Extract JSON from the response
-            json_match = re.search(r'\{[\s\S]*\}', content)
-            if not json_match:
+            # Decode the JSON object embedded in the response in place; the
+            # C scanner stops at its closing brace, so no regex or slicing
+            start = content.find('{')
+            if start == -1:
                 raise ReviewError("Could not find JSON in Claude's response")
 
-            json_str = json_match.group(0)
-            review_data = json.loads(json_str)
+            review_data, _ = _json_decoder.raw_decode(content, start)
 
             # Validate required fields
             required_fields = ['summary', 'comments']
@@ -261,13 +287,11 @@ Focus only on high-impact issues that require immediate attention."""
                 try:
                     # Validate severity and category
                     severity = comment_data['severity'].lower()
-                    if severity not in ['error', 'warning', 'suggestion', 'praise']:
+                    if severity not in VALID_SEVERITIES:
                         severity = 'suggestion'  # Default to suggestion if invalid
 
                     category = comment_data['category'].lower()
-                    valid_categories = [
-                        'security', 'performance', 'style', 'logic', 'documentation', 'best_practices']
-                    if category not in valid_categories:
+                    if category not in VALID_CATEGORIES:
                         category = 'best_practices'  # Default if invalid
 
                     comments.append(ReviewComment(
@@ -310,6 +334,10 @@ Focus only on high-impact issues that require immediate attention."""
         except Exception:
             return False
 
+    async def close(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        await self.client.close()
+
     def get_token_limit(self) -> int:
         """Get the maximum token limit for the model."""
         # Claude 3 Sonnet token limit
@@ -22,6 +22,10 @@ class BaseProvider(ABC):
         """Validate the provider configuration."""
         pass
 
+    async def close(self) -> None:
+        """Release any resources held by the provider."""
+        pass
+
     @abstractmethod
     def get_token_limit(self) -> int:
         """Get the maximum token limit for the model."""
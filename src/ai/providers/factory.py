@@ -17,7 +17,10 @@ class ProviderFactory:
     @classmethod
     def create(cls, provider_name: str, api_key: str, **kwargs) -> BaseProvider:
         """Create a provider instance."""
-        provider_class = cls._providers.get(provider_name.lower())
+        # Registered names are lowercase, so the usual caller hits directly
+        provider_class = cls._providers.get(provider_name)
+        if provider_class is None:
+            provider_class = cls._providers.get(provider_name.lower())
         if not provider_class:
             raise ProviderError(
                 f"Unknown provider: {provider_name}. Available providers: {', '.join(cls._providers.keys())}"
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TextIO
+from dataclasses import dataclass
 from datetime import datetime
 
 from ..models.response import AIResponse, ReviewComment
@@ -7,38 +8,32 @@ from ..models.request import ReviewType
 from ..storage.base import ReviewRecord
 
 
+@dataclass(slots=True)
 class ReportSection:
     """A section of a review report."""
+    title: str
+    content: str
+    severity: Optional[str] = None
+    metrics: Optional[Dict[str, Any]] = None
 
-    def __init__(
-        self,
-        title: str,
-        content: str,
-        severity: Optional[str] = None,
-        metrics: Optional[Dict[str, Any]] = None
-    ):
-        self.title = title
-        self.content = content
-        self.severity = severity
-        self.metrics = metrics or {}
+    def __post_init__(self):
+        self.metrics = self.metrics or {}
 
 
+@dataclass(slots=True)
 class ReviewReport:
     """Container for a complete review report."""
+    title: str
+    summary: str
+    sections: List[ReportSection]
+    timestamp: Optional[datetime] = None
+    metadata: Optional[Dict[str, Any]] = None
 
-    def __init__(
-        self,
-        title: str,
-        summary: str,
-        sections: List[ReportSection],
-        timestamp: datetime = datetime.utcnow(),
-        metadata: Optional[Dict[str, Any]] = None
-    ):
-        self.title = title
-        self.summary = summary
-        self.sections = sections
-        self.timestamp = timestamp
-        self.metadata = metadata or {}
+    def __post_init__(self):
+        # Stamped per report; a default value would be fixed at import time
+        if self.timestamp is None:
+            self.timestamp = datetime.utcnow()
+        self.metadata = self.metadata or {}
 
     @property
     def total_sections(self) -> int:
@@ -48,6 +43,20 @@ class ReviewReport:
         """Get report sections with specified severity."""
         return [s for s in self.sections if s.severity == severity]
 
+    def render_to(self, out: TextIO) -> None:
+        """Write the sections to a text sink without joining them in memory.
+
+        Only each section's content is written, not its title: generators
+        put the section's Markdown heading in the content itself. Sections
+        are separated by a blank line and each ends with a newline.
+        """
+        for i, section in enumerate(self.sections):
+            if i:
+                out.write("\n")
+            out.write(section.content)
+            if not section.content.endswith("\n"):
+                out.write("\n")
+
 
 class ReportGenerator(ABC):
     """Base class for report generators."""
@@ -1,15 +1,33 @@
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from collections import Counter, defaultdict
 import statistics
-from collections import Counter
 
 from .base import ReportGenerator, ReviewReport, ReportSection
+# Standard templates are registered when the templates package is imported
 from .templates import registry
-from .templates.standard import ExecutiveSummaryTemplate, SecurityAuditTemplate, PerformanceReportTemplate
-from ..models.response import AIResponse
+from ..models.response import AIResponse, SEVERITY_ORDER
 from ..models.request import ReviewType
 from ..storage.base import ReviewRecord
 
+# Fully rendered severity headings, so formatting a comment is a lookup
+SEVERITY_LABELS = {
+    "error": "🔴 Error",
+    "warning": "🟡 Warning",
+    "suggestion": "🔵 Suggestion",
+    "praise": "💚 Praise"
+}
+
+# The multi-file overview always has these rows, so its table is laid out once
+OVERALL_METRICS_TABLE = (
+    "| Metric | Value |\n"
+    "|--------|-------|\n"
+    "| Total Files | {total_files} |\n"
+    "| Total Issues | {total_issues} |\n"
+    "| Average Issues per File | {avg_issues} |\n"
+    "| Average Quality Score | {avg_score} |\n"
+)
+
 
 class MarkdownReportGenerator(ReportGenerator):
     """Generate reports in Markdown format."""
@@ -17,40 +35,29 @@ class MarkdownReportGenerator(ReportGenerator):
     def __init__(self, include_metrics: bool = True):
         self.include_metrics = include_metrics
 
-        # Register standard templates
-        registry.register(ExecutiveSummaryTemplate())
-        registry.register(SecurityAuditTemplate())
-        registry.register(PerformanceReportTemplate())
-
     def _format_severity(self, severity: str) -> str:
         """Format severity level with emoji."""
-        severity_icons = {
-            "error": "🔴",
-            "warning": "🟡",
-            "suggestion": "🔵",
-            "praise": "💚"
-        }
-        return f"{severity_icons.get(severity, '•')} {severity.title()}"
+        label = SEVERITY_LABELS.get(severity)
+        return label if label is not None else f"• {severity.title()}"
 
     def _format_metrics(self, metrics: Dict[str, Any]) -> str:
         """Format metrics as a Markdown table."""
         if not metrics:
             return ""
 
-        table = "| Metric | Value |\n|--------|-------|\n"
+        parts = ["| Metric | Value |\n|--------|-------|\n"]
         for key, value in metrics.items():
             if isinstance(value, float):
                 value = f"{value:.2f}"
-            table += f"| {key} | {value} |\n"
-        return table
+            parts.append(f"| {key} | {value} |\n")
+        return "".join(parts)
 
     def _calculate_review_metrics(self, review: AIResponse) -> Dict[str, Any]:
         """Calculate metrics for a single review."""
         if not self.include_metrics:
             return {}
 
-        severity_counts = Counter(c.severity for c in review.comments)
-        category_counts = Counter(c.category for c in review.comments)
+        severity_counts = review.severity_counts
 
         return {
             "Total Comments": len(review.comments),
@@ -70,6 +77,21 @@ class MarkdownReportGenerator(ReportGenerator):
         template_id: Optional[str] = None
     ) -> ReviewReport:
         """Generate a Markdown report for a single file review."""
+        return self._generate_file_report_sync(
+            review, file_path, review_type, include_code, template_id)
+
+    def _generate_file_report_sync(
+        self,
+        review: AIResponse,
+        file_path: str,
+        review_type: ReviewType,
+        include_code: bool,
+        template_id: Optional[str]
+    ) -> ReviewReport:
+        """Build a single-file report; pure CPU work, so no coroutine needed."""
+        review_type_value = review_type.value
+        # One clock read, shared by the rendered text and the report object
+        generated_at = datetime.utcnow()
         if template_id:
             template = registry.get_template(template_id)
             if template:
@@ -77,7 +99,8 @@ class MarkdownReportGenerator(ReportGenerator):
                     "review": review,
                     "file_path": file_path,
                     "review_type": review_type,
-                    "include_code": include_code
+                    "include_code": include_code,
+                    "report_date": generated_at.strftime('%Y-%m-%d')
                 }
                 if template.validate_context(context):
                     sections = template.render(context)
@@ -85,10 +108,11 @@ class MarkdownReportGenerator(ReportGenerator):
                         title=f"{template.name}: {file_path}",
                         summary=review.summary,
                         sections=sections,
+                        timestamp=generated_at,
                         metadata={
                             "template_id": template_id,
                             "file_path": file_path,
-                            "review_type": review_type.value
+                            "review_type": review_type_value
                         }
                     )
 
@@ -103,30 +127,35 @@ class MarkdownReportGenerator(ReportGenerator):
 
 ### File Information
 - **File:** `{file_path}`
-- **Review Type:** {review_type.value}
-- **Timestamp:** {datetime.utcnow().isoformat()}
+- **Review Type:** {review_type_value}
+- **Timestamp:** {generated_at.isoformat()}
 
 {self._format_metrics(metrics) if metrics else ""}""",
             metrics=metrics
         )
 
-        # Comments by severity
+        # Comments by severity, bucketed in a single pass
+        buckets = {severity: [] for severity in SEVERITY_ORDER}
+        for comment in review.comments:
+            bucket = buckets.get(comment.severity)
+            if bucket is not None:
+                bucket.append(comment)
+
         severity_sections = []
-        for severity in ["error", "warning", "suggestion", "praise"]:
-            comments = review.get_comments_by_severity(severity)
+        for severity, comments in buckets.items():
             if not comments:
                 continue
 
-            content = f"## {self._format_severity(severity)} Comments\n\n"
+            content_parts = [f"## {self._format_severity(severity)} Comments\n\n"]
             for comment in comments:
-                content += f"### {'Line ' + str(comment.line_number) if comment.line_number else 'General'}\n"
-                content += f"{comment.content}\n\n"
+                content_parts.append(f"### {'Line ' + str(comment.line_number) if comment.line_number else 'General'}\n")
+                content_parts.append(f"{comment.content}\n\n")
                 if comment.suggested_fix and include_code:
-                    content += f"**Suggested Fix:**\n```\n{comment.suggested_fix}\n```\n\n"
+                    content_parts.append(f"**Suggested Fix:**\n```\n{comment.suggested_fix}\n```\n\n")
 
             severity_sections.append(ReportSection(
                 title=f"{severity.title()} Comments",
-                content=content,
+                content="".join(content_parts),
                 severity=severity,
                 metrics={"count": len(comments)}
             ))
@@ -135,9 +164,10 @@ class MarkdownReportGenerator(ReportGenerator):
             title=f"Code Review: {file_path}",
             summary=review.summary,
             sections=[overview] + severity_sections,
+            timestamp=generated_at,
             metadata={
                 "file_path": file_path,
-                "review_type": review_type.value,
+                "review_type": review_type_value,
                 "metrics": metrics
             }
         )
@@ -150,25 +180,18 @@ class MarkdownReportGenerator(ReportGenerator):
         template_id: Optional[str] = None
     ) -> ReviewReport:
         """Generate a Markdown report for multiple file reviews."""
-        all_metrics = {}
+        review_type_value = review_type.value
         file_sections = []
         total_issues = 0
 
-        # Generate individual file reports
+        # A file's section only needs its summary and metrics, so the full
+        # per-file reports (whose summary is the review's) are not built
         for file_path, review in reviews.items():
-            report = await self.generate_file_report(
-                review,
-                file_path,
-                review_type,
-                include_code,
-                template_id
-            )
             metrics = self._calculate_review_metrics(review)
-            all_metrics[file_path] = metrics
             total_issues += len(review.comments)
 
             # Add file section
-            file_content = f"## {file_path}\n\n{report.summary}\n\n"
+            file_content = f"## {file_path}\n\n{review.summary}\n\n"
             file_content += self._format_metrics(metrics) if metrics else ""
             file_sections.append(ReportSection(
                 title=file_path,
@@ -177,16 +200,25 @@ class MarkdownReportGenerator(ReportGenerator):
             ))
 
         # Calculate overall metrics
+        avg_issues = total_issues / len(reviews) if reviews else 0
+        scores = [r.score for r in reviews.values() if r.score is not None]
+        avg_score = statistics.fmean(scores) if scores else None
         overall_metrics = {
             "Total Files": len(reviews),
             "Total Issues": total_issues,
-            "Average Issues per File": total_issues / len(reviews) if reviews else 0,
-            "Average Quality Score": statistics.mean(
-                [r.score for r in reviews.values() if r.score is not None]
-            ) if any(r.score is not None for r in reviews.values()) else None
+            "Average Issues per File": avg_issues,
+            "Average Quality Score": avg_score
         }
+        # Same table _format_metrics would render, from the fixed layout
+        metrics_table = OVERALL_METRICS_TABLE.format(
+            total_files=len(reviews),
+            total_issues=total_issues,
+            avg_issues=f"{avg_issues:.2f}" if reviews else avg_issues,
+            avg_score=f"{avg_score:.2f}" if avg_score is not None else avg_score
+        )
 
         # Create overview section
+        generated_at = datetime.utcnow()
         overview = ReportSection(
             title="Overview",
             content=f"""# Multi-File Review Report
@@ -194,10 +226,10 @@ class MarkdownReportGenerator(ReportGenerator):
 ## Summary
 - Reviewed {len(reviews)} files
 - Found {total_issues} total issues
-- Review Type: {review_type.value}
-- Generated: {datetime.utcnow().isoformat()}
+- Review Type: {review_type_value}
+- Generated: {generated_at.isoformat()}
 
-{self._format_metrics(overall_metrics)}""",
+{metrics_table}""",
             metrics=overall_metrics
         )
 
@@ -205,8 +237,9 @@ class MarkdownReportGenerator(ReportGenerator):
             title="Multi-File Code Review Report",
             summary=f"Review of {len(reviews)} files",
             sections=[overview] + file_sections,
+            timestamp=generated_at,
             metadata={
-                "review_type": review_type.value,
+                "review_type": review_type_value,
                 "file_count": len(reviews),
                 "metrics": overall_metrics,
                 "template_id": template_id
@@ -220,6 +253,7 @@ class MarkdownReportGenerator(ReportGenerator):
         review_type: Optional[ReviewType] = None
     ) -> ReviewReport:
         """Generate a Markdown report analyzing review history."""
+        review_type_value = review_type.value if review_type else None
         if not reviews:
             return ReviewReport(
                 title="Historical Review Analysis",
@@ -231,7 +265,7 @@ class MarkdownReportGenerator(ReportGenerator):
         review_counts = len(reviews)
         quality_scores = [
             r.review_response.score for r in reviews if r.review_response.score is not None]
-        avg_score = statistics.mean(quality_scores) if quality_scores else None
+        avg_score = statistics.fmean(quality_scores) if quality_scores else None
 
         metrics = {
             "Total Reviews": review_counts,
@@ -245,25 +279,25 @@ class MarkdownReportGenerator(ReportGenerator):
             title="Historical Analysis Overview",
             content=f"""# Code Review History Report
 {f'## File: `{file_path}`' if file_path else '## All Files'}
-{f'Review Type: {review_type.value}' if review_type else ''}
+{f'Review Type: {review_type_value}' if review_type else ''}
 
 {self._format_metrics(metrics)}""",
             metrics=metrics
         )
 
         # Create trend analysis section
-        trend_content = "## Quality Score Trend\n\n"
+        trend_parts = ["## Quality Score Trend\n\n"]
         if quality_scores:
-            trend_content += "Quality scores over time:\n\n"
+            trend_parts.append("Quality scores over time:\n\n")
             for review in sorted(reviews, key=lambda r: r.timestamp):
                 if review.review_response.score is not None:
-                    trend_content += f"- {review.timestamp.isoformat()}: {review.review_response.score:.2f}\n"
+                    trend_parts.append(f"- {review.timestamp.isoformat()}: {review.review_response.score:.2f}\n")
         else:
-            trend_content += "No quality scores available for trend analysis.\n"
+            trend_parts.append("No quality scores available for trend analysis.\n")
 
         trend_section = ReportSection(
             title="Trend Analysis",
-            content=trend_content
+            content="".join(trend_parts)
         )
 
         return ReviewReport(
@@ -272,7 +306,7 @@ class MarkdownReportGenerator(ReportGenerator):
             sections=[overview, trend_section],
             metadata={
                 "file_path": file_path,
-                "review_type": review_type.value if review_type else None,
+                "review_type": review_type_value,
                 "metrics": metrics
             }
         )
@@ -285,6 +319,7 @@ class MarkdownReportGenerator(ReportGenerator):
         review_type: Optional[ReviewType] = None
     ) -> ReviewReport:
         """Generate a Markdown report analyzing review trends over time."""
+        review_type_value = review_type.value if review_type else None
         if not reviews:
             return ReviewReport(
                 title="Review Trend Analysis",
@@ -292,22 +327,24 @@ class MarkdownReportGenerator(ReportGenerator):
                 sections=[]
             )
 
-        # Calculate trend metrics
-        reviews_by_date = {}
+        # Calculate trend metrics: one pass tallies each day's reviews and
+        # collects its scores, so no day is rescanned afterwards
+        reviews_by_date = Counter()
+        scores_by_date = defaultdict(list)
         for review in reviews:
             date = review.timestamp.date()
-            if date not in reviews_by_date:
-                reviews_by_date[date] = []
-            reviews_by_date[date].append(review)
+            reviews_by_date[date] += 1
+            score = review.review_response.score
+            if score is not None:
+                scores_by_date[date].append(score)
 
         daily_metrics = []
-        for date, day_reviews in sorted(reviews_by_date.items()):
-            scores = [
-                r.review_response.score for r in day_reviews if r.review_response.score is not None]
+        for date, review_count in sorted(reviews_by_date.items()):
+            scores = scores_by_date.get(date)
             daily_metrics.append({
                 "date": date.isoformat(),
-                "review_count": len(day_reviews),
-                "avg_score": statistics.mean(scores) if scores else None
+                "review_count": review_count,
+                "avg_score": statistics.fmean(scores) if scores else None
             })
 
         # Create overview section
@@ -315,7 +352,7 @@ class MarkdownReportGenerator(ReportGenerator):
             title="Trend Analysis Overview",
             content=f"""# Review Trend Analysis
 ## Time Period: {start_time.date().isoformat()} to {end_time.date().isoformat()}
-{f'Review Type: {review_type.value}' if review_type else ''}
+{f'Review Type: {review_type_value}' if review_type else ''}
 
 ### Overall Statistics
 - Total Reviews: {len(reviews)}
@@ -329,15 +366,17 @@ class MarkdownReportGenerator(ReportGenerator):
         )
 
         # Create daily breakdown section
-        daily_content = "## Daily Breakdown\n\n"
-        daily_content += "| Date | Reviews | Avg Score |\n|------|----------|------------|\n"
+        daily_parts = [
+            "## Daily Breakdown\n\n",
+            "| Date | Reviews | Avg Score |\n|------|----------|------------|\n"
+        ]
         for metric in daily_metrics:
             score = f"{metric['avg_score']:.2f}" if metric['avg_score'] is not None else "N/A"
-            daily_content += f"| {metric['date']} | {metric['review_count']} | {score} |\n"
+            daily_parts.append(f"| {metric['date']} | {metric['review_count']} | {score} |\n")
 
         daily_section = ReportSection(
             title="Daily Breakdown",
-            content=daily_content
+            content="".join(daily_parts)
         )
 
         return ReviewReport(
@@ -347,7 +386,7 @@ class MarkdownReportGenerator(ReportGenerator):
             metadata={
                 "start_time": start_time.isoformat(),
                 "end_time": end_time.isoformat(),
-                "review_type": review_type.value if review_type else None,
+                "review_type": review_type_value,
                 "daily_metrics": daily_metrics
             }
         )
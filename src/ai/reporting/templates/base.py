@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, FrozenSet
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
 
 from ...models.response import AIResponse
@@ -49,12 +50,15 @@ class ReportTemplate(ABC):
         """Render the template with the given context."""
         pass
 
+    @cached_property
+    def _required_variables(self) -> FrozenSet[str]:
+        """Names of required variables, collected once per template."""
+        return frozenset(
+            name for name, var in self.variables.items() if var.required)
+
     def validate_context(self, context: Dict[str, Any]) -> bool:
         """Validate that all required variables are present."""
-        for var_name, var_def in self.variables.items():
-            if var_def.required and var_name not in context:
-                return False
-        return True
+        return self._required_variables <= context.keys()
 
 
 class TemplateRegistry:
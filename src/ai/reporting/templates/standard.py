@@ -21,35 +21,41 @@ class ExecutiveSummaryTemplate(ReportTemplate):
     def description(self) -> str:
         return "A concise summary focusing on key findings and recommendations"
 
+    # Built once per class rather than on every property access
+    VARIABLES = {
+        "review": TemplateVariable(
+            name="review",
+            description="The review response object",
+            required=True
+        ),
+        "file_path": TemplateVariable(
+            name="file_path",
+            description="Path to the reviewed file",
+            required=True
+        ),
+        "review_type": TemplateVariable(
+            name="review_type",
+            description="Type of review performed",
+            required=True
+        )
+    }
+
     @property
     def variables(self) -> Dict[str, TemplateVariable]:
-        return {
-            "review": TemplateVariable(
-                name="review",
-                description="The review response object",
-                required=True
-            ),
-            "file_path": TemplateVariable(
-                name="file_path",
-                description="Path to the reviewed file",
-                required=True
-            ),
-            "review_type": TemplateVariable(
-                name="review_type",
-                description="Type of review performed",
-                required=True
-            )
-        }
+        return self.VARIABLES
 
     def render(self, context: Dict[str, Any]) -> List[ReportSection]:
         review: AIResponse = context["review"]
+        score = review.score
         file_path: str = context["file_path"]
+        report_date: str = context.get("report_date") or datetime.utcnow().strftime('%Y-%m-%d')
         review_type: ReviewType = context["review_type"]
 
-        # Calculate metrics
-        critical_issues = len(review.get_comments_by_severity("error"))
-        warnings = len(review.get_comments_by_severity("warning"))
-        suggestions = len(review.get_comments_by_severity("suggestion"))
+        # Calculate metrics from the single-pass severity tally
+        severity_counts = review.severity_counts
+        critical_issues = severity_counts["error"]
+        warnings = severity_counts["warning"]
+        suggestions = severity_counts["suggestion"]
 
         # Create summary section
         summary = ReportSection(
@@ -59,8 +65,8 @@ class ExecutiveSummaryTemplate(ReportTemplate):
 ## Overview
 - **File:** `{file_path}`
 - **Review Type:** {review_type.value}
-- **Quality Score:** {review.score if review.score is not None else 'N/A'}
-- **Review Date:** {datetime.utcnow().strftime('%Y-%m-%d')}
+- **Quality Score:** {score if score is not None else 'N/A'}
+- **Review Date:** {report_date}
 
 ## Key Findings
 - Critical Issues: {critical_issues}
@@ -73,20 +79,20 @@ class ExecutiveSummaryTemplate(ReportTemplate):
                 "critical_issues": critical_issues,
                 "warnings": warnings,
                 "suggestions": suggestions,
-                "quality_score": review.score
+                "quality_score": score
             }
         )
 
         # Create critical issues section if any
         sections = [summary]
         if critical_issues > 0:
-            critical_content = "## Critical Issues\n\n"
+            critical_parts = ["## Critical Issues\n\n"]
             for comment in review.get_comments_by_severity("error"):
-                critical_content += f"- **{comment.category}** (Line {comment.line_number or 'N/A'}):\n  {comment.content}\n\n"
+                critical_parts.append(f"- **{comment.category}** (Line {comment.line_number or 'N/A'}):\n  {comment.content}\n\n")
 
             sections.append(ReportSection(
                 title="Critical Issues",
-                content=critical_content,
+                content="".join(critical_parts),
                 severity="error"
             ))
 
@@ -108,30 +114,34 @@ class SecurityAuditTemplate(ReportTemplate):
     def description(self) -> str:
         return "A comprehensive security audit report with detailed findings"
 
+    VARIABLES = {
+        "review": TemplateVariable(
+            name="review",
+            description="The review response object",
+            required=True
+        ),
+        "file_path": TemplateVariable(
+            name="file_path",
+            description="Path to the reviewed file",
+            required=True
+        ),
+        "include_code": TemplateVariable(
+            name="include_code",
+            description="Whether to include code snippets",
+            required=False,
+            default=False
+        )
+    }
+
     @property
     def variables(self) -> Dict[str, TemplateVariable]:
-        return {
-            "review": TemplateVariable(
-                name="review",
-                description="The review response object",
-                required=True
-            ),
-            "file_path": TemplateVariable(
-                name="file_path",
-                description="Path to the reviewed file",
-                required=True
-            ),
-            "include_code": TemplateVariable(
-                name="include_code",
-                description="Whether to include code snippets",
-                required=False,
-                default=False
-            )
-        }
+        return self.VARIABLES
 
     def render(self, context: Dict[str, Any]) -> List[ReportSection]:
         review: AIResponse = context["review"]
+        score = review.score
         file_path: str = context["file_path"]
+        report_date: str = context.get("report_date") or datetime.utcnow().strftime('%Y-%m-%d')
         include_code: bool = context.get("include_code", False)
 
         # Overview section
@@ -141,49 +151,47 @@ class SecurityAuditTemplate(ReportTemplate):
 
 ## File Information
 - **File:** `{file_path}`
-- **Audit Date:** {datetime.utcnow().strftime('%Y-%m-%d')}
-- **Security Score:** {review.score if review.score is not None else 'N/A'}
+- **Audit Date:** {report_date}
+- **Security Score:** {score if score is not None else 'N/A'}
 
 ## Summary
 {review.summary}""",
             metrics={
-                "security_score": review.score
+                "security_score": score
             }
         )
 
-        # Categorize security issues
+        # Categorize security issues by severity in a single pass
         sections = [overview]
-        security_comments = [
-            c for c in review.comments if c.category == "security"]
-
-        if security_comments:
-            by_severity = {
-                "error": [],
-                "warning": [],
-                "suggestion": []
-            }
-            for comment in security_comments:
-                if comment.severity in by_severity:
-                    by_severity[comment.severity].append(comment)
-
-            # Create sections for each severity
-            for severity, comments in by_severity.items():
-                if not comments:
-                    continue
-
-                content = f"## {severity.title()} Level Security Issues\n\n"
-                for comment in comments:
-                    content += f"### Issue at Line {comment.line_number or 'N/A'}\n"
-                    content += f"{comment.content}\n\n"
-                    if comment.suggested_fix and include_code:
-                        content += f"**Suggested Fix:**\n```\n{comment.suggested_fix}\n```\n\n"
-
-                sections.append(ReportSection(
-                    title=f"{severity.title()} Security Issues",
-                    content=content,
-                    severity=severity,
-                    metrics={"count": len(comments)}
-                ))
+        by_severity = {
+            "error": [],
+            "warning": [],
+            "suggestion": []
+        }
+        for comment in review.comments:
+            if comment.category == "security":
+                bucket = by_severity.get(comment.severity)
+                if bucket is not None:
+                    bucket.append(comment)
+
+        # Create sections for each severity
+        for severity, comments in by_severity.items():
+            if not comments:
+                continue
+
+            content_parts = [
+                f"### Issue at Line {comment.line_number or 'N/A'}\n{comment.content}\n\n"
+                + (f"**Suggested Fix:**\n```\n{comment.suggested_fix}\n```\n\n"
+                   if comment.suggested_fix and include_code else "")
+                for comment in comments
+            ]
+
+            sections.append(ReportSection(
+                title=f"{severity.title()} Security Issues",
+                content=f"## {severity.title()} Level Security Issues\n\n" + "".join(content_parts),
+                severity=severity,
+                metrics={"count": len(comments)}
+            ))
 
         return sections
 
@@ -203,30 +211,34 @@ class PerformanceReportTemplate(ReportTemplate):
     def description(self) -> str:
         return "A detailed performance analysis with optimization recommendations"
 
+    VARIABLES = {
+        "review": TemplateVariable(
+            name="review",
+            description="The review response object",
+            required=True
+        ),
+        "file_path": TemplateVariable(
+            name="file_path",
+            description="Path to the reviewed file",
+            required=True
+        ),
+        "include_metrics": TemplateVariable(
+            name="include_metrics",
+            description="Whether to include detailed metrics",
+            required=False,
+            default=True
+        )
+    }
+
     @property
     def variables(self) -> Dict[str, TemplateVariable]:
-        return {
-            "review": TemplateVariable(
-                name="review",
-                description="The review response object",
-                required=True
-            ),
-            "file_path": TemplateVariable(
-                name="file_path",
-                description="Path to the reviewed file",
-                required=True
-            ),
-            "include_metrics": TemplateVariable(
-                name="include_metrics",
-                description="Whether to include detailed metrics",
-                required=False,
-                default=True
-            )
-        }
+        return self.VARIABLES
 
     def render(self, context: Dict[str, Any]) -> List[ReportSection]:
         review: AIResponse = context["review"]
+        score = review.score
         file_path: str = context["file_path"]
+        report_date: str = context.get("report_date") or datetime.utcnow().strftime('%Y-%m-%d')
         include_metrics: bool = context.get("include_metrics", True)
 
         # Overview section
@@ -236,13 +248,13 @@ class PerformanceReportTemplate(ReportTemplate):
 
 ## File Information
 - **File:** `{file_path}`
-- **Analysis Date:** {datetime.utcnow().strftime('%Y-%m-%d')}
-- **Performance Score:** {review.score if review.score is not None else 'N/A'}
+- **Analysis Date:** {report_date}
+- **Performance Score:** {score if score is not None else 'N/A'}
 
 ## Summary
 {review.summary}""",
             metrics={
-                "performance_score": review.score
+                "performance_score": score
             }
         )
 
@@ -252,20 +264,20 @@ class PerformanceReportTemplate(ReportTemplate):
         perf_comments = [
             c for c in review.comments if c.category == "performance"]
         if perf_comments:
-            content = "## Performance Issues\n\n"
-            for comment in perf_comments:
-                content += f"### {comment.severity.title()} Priority Issue"
-                if comment.line_number:
-                    content += f" (Line {comment.line_number})"
-                content += f"\n{comment.content}\n\n"
-                if comment.suggested_fix:
-                    content += f"**Optimization Suggestion:**\n```\n{comment.suggested_fix}\n```\n\n"
+            content_parts = [
+                f"### {comment.severity.title()} Priority Issue"
+                + (f" (Line {comment.line_number})" if comment.line_number else "")
+                + f"\n{comment.content}\n\n"
+                + (f"**Optimization Suggestion:**\n```\n{comment.suggested_fix}\n```\n\n"
+                   if comment.suggested_fix else "")
+                for comment in perf_comments
+            ]
 
             sections.append(ReportSection(
                 title="Performance Issues",
-                content=content,
+                content="## Performance Issues\n\n" + "".join(content_parts),
                 metrics={"total_issues": len(
-                    perf_comments)} if include_metrics else None
+                    perf_comments)} if include_metrics else {}
             ))
 
         return sections
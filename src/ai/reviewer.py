@@ -1,13 +1,16 @@
-from typing import List, Dict, Optional, Union
+from typing import Any, List, Dict, Optional, Union
 from pathlib import Path
 import asyncio
 import logging
+import time
+from dataclasses import fields
 from datetime import datetime
 
 from .models.request import AIRequest, CodeContext, ReviewSettings, ReviewType
 from .models.response import AIResponse, ReviewComment
 from .providers.factory import ProviderFactory
 from .storage.sqlite import SQLiteStorage
+from .storage.batching import BatchingStorage
 from .storage.base import ReviewRecord
 from .exceptions import ReviewError, ConfigurationError, StorageError
 from .reporting.base import ReportGenerator, ReviewReport
@@ -18,10 +21,19 @@ logger = logging.getLogger(__name__)
 class ReviewResult:
     """Container for review results of multiple files."""
 
+    __slots__ = (
+        "reviews", "start_time", "end_time", "total_files", "successful_reviews",
+        "failed_reviews", "errors", "review_ids", "_started",
+        "_elapsed"
+    )
+
     def __init__(self):
         self.reviews: Dict[str, AIResponse] = {}
         self.start_time: datetime = datetime.utcnow()
         self.end_time: Optional[datetime] = None
+        # Monotonic clock readings for duration; wall times are for display
+        self._started: float = time.perf_counter()
+        self._elapsed: Optional[float] = None
         self.total_files: int = 0
         self.successful_reviews: int = 0
         self.failed_reviews: int = 0
@@ -33,8 +45,15 @@ class ReviewResult:
         """Get review duration in seconds."""
         if not self.end_time:
             return 0
+        if self._elapsed is not None:
+            return self._elapsed
         return (self.end_time - self.start_time).total_seconds()
 
+    def mark_finished(self):
+        """Record the end of the review batch."""
+        self._elapsed = time.perf_counter() - self._started
+        self.end_time = datetime.utcnow()
+
     def add_review(self, file_path: str, review: AIResponse, review_id: Optional[str] = None):
         """Add a successful review result."""
         self.reviews[file_path] = review
@@ -49,11 +68,12 @@ class ReviewResult:
 
     def get_critical_issues(self) -> List[tuple[str, ReviewComment]]:
         """Get all error-level comments across all reviews."""
-        critical_issues = []
-        for file_path, review in self.reviews.items():
-            for comment in review.get_comments_by_severity("error"):
-                critical_issues.append((file_path, comment))
-        return critical_issues
+        return [
+            (file_path, comment)
+            for file_path, review in self.reviews.items()
+            for comment in review.comments
+            if comment.severity == "error"
+        ]
 
 
 class Reviewer:
@@ -66,6 +86,7 @@ class Reviewer:
         default_review_type: ReviewType = ReviewType.FULL,
         storage_path: Optional[str] = "reviews.db",
         report_generator: Optional[ReportGenerator] = None,
+        batch_storage_writes: bool = False,
         **provider_kwargs
     ):
         """Initialize the reviewer with a specific provider."""
@@ -78,6 +99,9 @@ class Reviewer:
         self.default_review_type = default_review_type
         self.default_settings = ReviewSettings()
         self.storage = SQLiteStorage(storage_path) if storage_path else None
+        if self.storage and batch_storage_writes:
+            # Queue saves and write them in batched transactions
+            self.storage = BatchingStorage(self.storage)
 
         # Initialize report generator
         if report_generator is None:
@@ -92,17 +116,27 @@ class Reviewer:
         review_type: Optional[ReviewType] = None,
         settings: Optional[ReviewSettings] = None,
         store_review: bool = True,
+        context: Optional[CodeContext] = None,
         **context_kwargs
     ) -> tuple[AIResponse, Optional[str]]:
-        """Review a single file and optionally store the review."""
+        """Review a single file and optionally store the review.
+
+        Callers that already hold a CodeContext can pass it as ``context``;
+        otherwise one is built from ``file_path``, ``content`` and
+        ``context_kwargs``.
+        """
         try:
-            # Create review request
-            request = AIRequest(
-                code_context=CodeContext(
+            context_given = context is not None
+            if not context_given:
+                context = CodeContext(
                     file_path=str(file_path),
                     content=content,
                     **context_kwargs
-                ),
+                )
+
+            # Create review request
+            request = AIRequest(
+                code_context=context,
                 review_type=review_type or self.default_review_type,
                 review_params={},
                 settings=settings or self.default_settings
@@ -124,17 +158,29 @@ class Reviewer:
                         str(file_path),
                         request.review_type,
                         review,
-                        context_kwargs
+                        self._context_metadata(context) if context_given else context_kwargs
                     )
                 except StorageError as e:
-                    logger.warning(f"Failed to store review: {str(e)}")
+                    logger.warning("Failed to store review: %s", e)
 
             return review, review_id
 
         except Exception as e:
-            logger.error(f"Failed to review file {file_path}: {str(e)}")
+            # Logging formats lazily, only if the record is actually emitted
+            logger.error("Failed to review file %s: %s", file_path, e)
+            if isinstance(e, ReviewError):
+                raise
             raise ReviewError(f"Review failed for {file_path}: {str(e)}")
 
+    @staticmethod
+    def _context_metadata(context: CodeContext) -> Dict[str, Any]:
+        """Context details stored with a review, as a kwargs caller sends them."""
+        return {
+            f.name: getattr(context, f.name)
+            for f in fields(context)
+            if f.name not in ('file_path', 'content')
+        }
+
     async def review_files(
         self,
         files: Dict[str, str],
@@ -145,36 +191,58 @@ class Reviewer:
         **context_kwargs
     ) -> ReviewResult:
         """Review multiple files concurrently."""
+        if max_concurrent < 1:
+            raise ValueError(
+                f"max_concurrent must be at least 1, got {max_concurrent}")
+
         result = ReviewResult()
         result.total_files = len(files)
 
-        # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(max_concurrent)
+        # Reviews are stored together once the batch is done, in one
+        # transaction: a failed insert stores none of them, and a batch
+        # that is interrupted stores nothing
+        store = store_reviews and self.storage is not None
+        to_store = []
 
-        async def review_with_semaphore(file_path: str, content: str):
-            async with semaphore:
+        # A fixed pool of workers drains one shared iterator, so only
+        # max_concurrent coroutines exist however many files there are
+        pending = iter(files.items())
+
+        async def worker():
+            for file_path, content in pending:
                 try:
-                    review, review_id = await self.review_file(
+                    review, _ = await self.review_file(
                         file_path,
                         content,
                         review_type,
                         settings,
-                        store_reviews,
+                        False,
                         **context_kwargs
                     )
-                    result.add_review(file_path, review, review_id)
+                    result.add_review(file_path, review)
+                    if store:
+                        to_store.append((
+                            file_path,
+                            review_type or self.default_review_type,
+                            review,
+                            context_kwargs
+                        ))
                 except Exception as e:
                     result.add_error(file_path, str(e))
 
-        # Create tasks for all files
-        tasks = [
-            review_with_semaphore(file_path, content)
-            for file_path, content in files.items()
-        ]
-
         # Wait for all reviews to complete
-        await asyncio.gather(*tasks)
-        result.end_time = datetime.utcnow()
+        await asyncio.gather(
+            *(worker() for _ in range(min(max_concurrent, len(files))))
+        )
+
+        if to_store:
+            try:
+                review_ids = await self.storage.save_reviews_bulk(to_store)
+                for record, review_id in zip(to_store, review_ids):
+                    result.review_ids[record[0]] = review_id
+            except StorageError as e:
+                logger.warning("Failed to store reviews: %s", e)
+        result.mark_finished()
 
         return result
 
@@ -188,18 +256,17 @@ class Reviewer:
         **context_kwargs
     ) -> ReviewResult:
         """Review changed files with their diffs."""
-        files_with_context = {
-            file_path: content for file_path, (content, _) in files.items()
-        }
+        # Split contents and diffs in a single pass
+        files_with_context = {}
+        diffs = {}
+        for file_path, (content, diff) in files.items():
+            files_with_context[file_path] = content
+            if diff is not None:
+                diffs[file_path] = diff
 
         # Add diff information to context_kwargs
         context_kwargs["base_branch"] = base_branch
-        context_kwargs.update({
-            "diff": {
-                file_path: diff for file_path, (_, diff) in files.items()
-                if diff is not None
-            }
-        })
+        context_kwargs["diff"] = diffs
 
         return await self.review_files(
             files_with_context,
@@ -209,6 +276,26 @@ class Reviewer:
             **context_kwargs
         )
 
+    async def __aenter__(self) -> 'Reviewer':
+        """Share one storage connection until the block exits."""
+        if self.storage:
+            await self.storage.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self):
+        """Release the provider's connections and the storage connection.
+
+        Queued reviews are written before the storage closes.
+        """
+        try:
+            await self.provider.close()
+        finally:
+            if self.storage:
+                await self.storage.close()
+
     def set_default_settings(self, settings: ReviewSettings):
         """Update default review settings."""
         self.default_settings = settings
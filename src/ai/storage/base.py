@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime
 
 from ..models.response import AIResponse
@@ -9,6 +9,10 @@ from ..models.request import ReviewType
 class ReviewRecord:
     """Record of a code review."""
 
+    __slots__ = (
+        "id", "file_path", "review_type", "review_response", "timestamp", "metadata"
+    )
+
     def __init__(
         self,
         id: str,
@@ -40,6 +44,17 @@ class StorageProvider(ABC):
         """Save a review and return its ID."""
         pass
 
+    async def save_reviews_bulk(
+        self,
+        records: List[Tuple[str, ReviewType, AIResponse, Optional[Dict]]]
+    ) -> List[str]:
+        """Save several (file_path, review_type, review, metadata) records.
+
+        Returns the IDs in record order. The default saves one at a time;
+        providers that can write in a single transaction override it.
+        """
+        return [await self.save_review(*record) for record in records]
+
     @abstractmethod
     async def get_review(self, review_id: str) -> Optional[ReviewRecord]:
         """Get a review by its ID."""
@@ -70,6 +85,18 @@ class StorageProvider(ABC):
         """Delete a review by its ID."""
         pass
 
+    async def close(self) -> None:
+        """Release any resources held by the provider."""
+        pass
+
+    async def __aenter__(self) -> 'StorageProvider':
+        """Use the provider for the duration of an ``async with`` block."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Release the provider's resources when the block exits."""
+        await self.close()
+
     @abstractmethod
     async def cleanup_old_reviews(self, older_than: datetime) -> int:
         """Delete reviews older than specified datetime."""
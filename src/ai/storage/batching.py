@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime
+from typing import List, Optional, Dict, Tuple
+
+from .base import StorageProvider, ReviewRecord
+from .sqlite import SQLiteStorage
+from ..models.response import AIResponse
+from ..models.request import ReviewType
+from ..exceptions import StorageError
+
+logger = logging.getLogger(__name__)
+
+
+class BatchingStorage(StorageProvider):
+    """Write-behind wrapper that batches SQLite review inserts.
+
+    ``save_review`` returns a client-generated ID immediately and queues the
+    row; queued rows are written in one transaction once ``batch_size`` rows
+    are pending or ``flush_interval`` seconds have passed. Reads flush first,
+    so a saved review is always visible to later queries. Rows whose write
+    fails stay queued and are retried by the next flush; ``close()`` raises
+    if they still can't be written.
+    """
+
+    def __init__(
+        self,
+        storage: SQLiteStorage,
+        batch_size: int = 50,
+        flush_interval: float = 0.5
+    ):
+        self.storage = storage
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: List[Tuple] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def save_review(
+        self,
+        file_path: str,
+        review_type: ReviewType,
+        review: AIResponse,
+        metadata: Optional[Dict] = None
+    ) -> str:
+        """Queue a review for saving and return its ID."""
+        review_id = str(uuid.uuid4())
+        try:
+            self._pending.append(self.storage._review_row(
+                review_id, file_path, review_type, review, metadata))
+        except Exception as e:
+            raise StorageError(f"Failed to save review: {str(e)}")
+
+        if len(self._pending) >= self.batch_size:
+            try:
+                await self.flush()
+            except StorageError as e:
+                # The row is queued and its ID valid; the next flush retries
+                logger.warning("Failed to write queued reviews: %s", e)
+        elif self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+        return review_id
+
+    async def save_reviews_bulk(
+        self,
+        records: List[Tuple[str, ReviewType, AIResponse, Optional[Dict]]]
+    ) -> List[str]:
+        """Save several reviews, writing them with anything already queued."""
+        review_ids = [str(uuid.uuid4()) for _ in records]
+        try:
+            self._pending.extend(
+                self.storage._review_row(review_id, *record)
+                for review_id, record in zip(review_ids, records)
+            )
+        except Exception as e:
+            raise StorageError(f"Failed to save reviews: {str(e)}")
+        try:
+            await self.flush()
+        except StorageError:
+            # The caller gets no IDs back, so these rows must not be written later
+            new_ids = set(review_ids)
+            self._pending = [row for row in self._pending if row[0] not in new_ids]
+            raise
+        return review_ids
+
+    async def _flush_later(self) -> None:
+        """Flush whatever is pending once the flush interval has passed."""
+        await asyncio.sleep(self.flush_interval)
+        self._flush_task = None
+        try:
+            await self.flush()
+        except StorageError as e:
+            logger.warning("Failed to write queued reviews: %s", e)
+
+    async def flush(self) -> None:
+        """Write all queued reviews in a single transaction."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        rows, self._pending = self._pending, []
+        if not rows:
+            return
+        try:
+            await self.storage._insert_rows(rows)
+        except Exception as e:
+            # Callers already hold these IDs, so keep the rows queued for the
+            # next flush (or close) rather than dropping them
+            self._pending[:0] = rows
+            raise StorageError(f"Failed to save {len(rows)} queued reviews: {str(e)}")
+
+    async def get_review(self, review_id: str) -> Optional[ReviewRecord]:
+        """Get a review by its ID."""
+        await self.flush()
+        return await self.storage.get_review(review_id)
+
+    async def get_file_reviews(
+        self,
+        file_path: str,
+        limit: Optional[int] = None,
+        review_type: Optional[ReviewType] = None
+    ) -> List[ReviewRecord]:
+        """Get review history for a file."""
+        await self.flush()
+        return await self.storage.get_file_reviews(file_path, limit, review_type)
+
+    async def get_reviews_in_timeframe(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        review_type: Optional[ReviewType] = None
+    ) -> List[ReviewRecord]:
+        """Get reviews within a timeframe."""
+        await self.flush()
+        return await self.storage.get_reviews_in_timeframe(
+            start_time, end_time, review_type)
+
+    async def delete_review(self, review_id: str) -> bool:
+        """Delete a review by its ID."""
+        await self.flush()
+        return await self.storage.delete_review(review_id)
+
+    async def cleanup_old_reviews(self, older_than: datetime) -> int:
+        """Delete reviews older than specified datetime."""
+        await self.flush()
+        return await self.storage.cleanup_old_reviews(older_than)
+
+    async def __aenter__(self) -> 'BatchingStorage':
+        """Enter the wrapped storage's shared-connection scope."""
+        await self.storage.__aenter__()
+        return self
+
+    async def close(self) -> None:
+        """Write anything still queued, then close the wrapped storage."""
+        try:
+            await self.flush()
+        finally:
+            await self.storage.close()
@@ -1,9 +1,11 @@
+import asyncio
 import json
 import sqlite3
 import uuid
-from datetime import datetime
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 
 import aiosqlite
 
@@ -12,14 +14,117 @@ from ..models.response import AIResponse
 from ..models.request import ReviewType
 from ..exceptions import StorageError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        # Non-string keys are stringified, matching the stdlib encoder
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+# catch the same exception whichever decoder is in use
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Column list for reads, named explicitly so row positions don't depend on
+# the table's physical column order
+REVIEW_COLUMNS = "id, file_path, review_type, review_response, timestamp, metadata"
+
+# Timestamps are stored as integer milliseconds since this (UTC) epoch
+_EPOCH = datetime(1970, 1, 1)
+_MILLISECOND = timedelta(milliseconds=1)
+
+
+def _to_millis(dt: datetime) -> int:
+    """Convert a datetime (naive values are UTC) to epoch milliseconds."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - _EPOCH) // _MILLISECOND
+
+
+def _from_millis(millis: int) -> datetime:
+    """Convert epoch milliseconds to a naive UTC datetime."""
+    return _EPOCH + millis * _MILLISECOND
+
 
 class SQLiteStorage(StorageProvider):
-    """SQLite-based storage provider for review history."""
+    """SQLite-based storage provider for review history.
+
+    Each query opens its own connection, unless it runs inside an
+    ``async with storage:`` block: there every query shares one connection,
+    so SQLite's page cache stays warm between calls, and it is closed when
+    the block exits.
+    """
+
+    # Applied once to each new connection
+    CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA mmap_size=268435456",
+    )
+
+    # Bumped whenever _ensure_db gains a migration; kept in PRAGMA user_version
+    SCHEMA_VERSION = 1
 
     def __init__(self, db_path: str = "reviews.db"):
         self.db_path = db_path
+        # Shared connection, open only inside an ``async with`` block
+        self._db: Optional[aiosqlite.Connection] = None
+        # Serializes use of the shared connection, so one caller's
+        # transaction never interleaves with another's statements
+        self._lock = asyncio.Lock()
         self._ensure_db()
 
+    async def __aenter__(self) -> 'SQLiteStorage':
+        """Open the connection that queries share until the block exits."""
+        async with self._lock:
+            if self._db is None:
+                self._db = await self._open()
+        return self
+
+    async def _open(self) -> aiosqlite.Connection:
+        """Open a connection with the tuning PRAGMAs applied."""
+        db = await aiosqlite.connect(self.db_path)
+        try:
+            for pragma in self.CONNECTION_PRAGMAS:
+                await db.execute(pragma)
+        except Exception:
+            await db.close()
+            raise
+        return db
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Hold the shared connection, or open one just for this call.
+
+        A connection's worker thread keeps the process alive until it is
+        closed, so outside a shared scope nothing is left open.
+        """
+        async with self._lock:
+            if self._db is not None:
+                yield self._db
+                return
+
+        db = await self._open()
+        try:
+            yield db
+        finally:
+            await db.close()
+
+    async def close(self) -> None:
+        """Close the shared connection, if one is open."""
+        async with self._lock:
+            if self._db is not None:
+                db, self._db = self._db, None
+                await db.close()
+
     def _ensure_db(self):
         """Ensure database and tables exist."""
         conn = sqlite3.connect(self.db_path)
@@ -31,15 +136,35 @@ class SQLiteStorage(StorageProvider):
                     file_path TEXT NOT NULL,
                     review_type TEXT NOT NULL,
                     review_response TEXT NOT NULL,
-                    timestamp DATETIME NOT NULL,
+                    timestamp INTEGER NOT NULL,
                     metadata TEXT
                 )
             """)
-            # Create indices for common queries
+            # WAL lets readers run during writes and needs fewer fsyncs;
+            # the mode is stored in the database file, so set it once here
+            cursor.execute("PRAGMA journal_mode=WAL")
+            # Create indices for common queries. The composite index serves
+            # file history lookups, with or without a review type, and also
+            # covers plain file_path lookups, replacing the old index on it
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_reviews_file_path
-                ON reviews(file_path)
+                CREATE INDEX IF NOT EXISTS idx_reviews_file_type_ts
+                ON reviews(file_path, review_type, timestamp DESC)
             """)
+            cursor.execute("DROP INDEX IF EXISTS idx_reviews_file_path")
+
+            version = cursor.execute("PRAGMA user_version").fetchone()[0]
+            if version < 1:
+                # Version 0 stored ISO-8601 text timestamps; rewrite them as
+                # epoch milliseconds (julianday 2440587.5 is the Unix epoch)
+                cursor.execute("""
+                    UPDATE reviews
+                    SET timestamp = CAST(ROUND(
+                        (julianday(timestamp) - 2440587.5) * 86400000
+                    ) AS INTEGER)
+                    WHERE typeof(timestamp) = 'text'
+                """)
+            if version < self.SCHEMA_VERSION:
+                cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_reviews_timestamp
                 ON reviews(timestamp)
@@ -50,7 +175,7 @@ class SQLiteStorage(StorageProvider):
 
     def _serialize_review(self, review: AIResponse) -> str:
         """Serialize review response to JSON."""
-        return json.dumps({
+        return _dumps({
             "comments": [
                 {
                     "line_number": c.line_number,
@@ -69,7 +194,7 @@ class SQLiteStorage(StorageProvider):
     def _deserialize_review(self, data: str) -> AIResponse:
         """Deserialize review response from JSON."""
         try:
-            review_data = json.loads(data)
+            review_data = _loads(data)
             from ..models.response import ReviewComment
 
             comments = [
@@ -92,56 +217,108 @@ class SQLiteStorage(StorageProvider):
         except (json.JSONDecodeError, KeyError) as e:
             raise StorageError(f"Failed to deserialize review: {str(e)}")
 
-    async def save_review(
+    def _review_row(
         self,
+        review_id: str,
         file_path: str,
         review_type: ReviewType,
         review: AIResponse,
         metadata: Optional[Dict] = None
-    ) -> str:
-        """Save a review and return its ID."""
-        review_id = str(uuid.uuid4())
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
+    ) -> Tuple:
+        """Build the reviews-table row for a review, stamped with the current time.
+
+        Protected API for write-behind wrappers such as BatchingStorage,
+        which queue rows and later pass them to ``_insert_rows``.
+        """
+        return (
+            review_id,
+            file_path,
+            review_type.value,
+            self._serialize_review(review),
+            _to_millis(datetime.utcnow()),
+            _dumps(metadata) if metadata else None
+        )
+
+    def _record_from_row(self, row: Tuple) -> ReviewRecord:
+        """Build a ReviewRecord from a row selected with REVIEW_COLUMNS."""
+        return ReviewRecord(
+            id=row[0],
+            file_path=row[1],
+            review_type=ReviewType(row[2]),
+            review_response=self._deserialize_review(row[3]),
+            timestamp=_from_millis(row[4]),
+            metadata=_loads(row[5]) if row[5] else None
+        )
+
+    async def _insert_rows(self, rows: List[Tuple]) -> None:
+        """Insert rows built by ``_review_row`` in a single transaction.
+
+        Protected API for write-behind wrappers; the insert is all or
+        nothing, so a failed batch can be retried as a whole.
+        """
+        async with self._connection() as db:
+            try:
+                # One statement for the whole batch: a single round trip to
+                # the connection thread and a single commit
+                await db.executemany(
                     """
                     INSERT INTO reviews (id, file_path, review_type, review_response, timestamp, metadata)
                     VALUES (?, ?, ?, ?, ?, ?)
                     """,
-                    (
-                        review_id,
-                        file_path,
-                        review_type.value,
-                        self._serialize_review(review),
-                        datetime.utcnow().isoformat(),
-                        json.dumps(metadata) if metadata else None
-                    )
+                    rows
                 )
                 await db.commit()
+            except Exception:
+                # The connection outlives this call, so don't leave a
+                # partial transaction for the next writer to commit
+                await db.rollback()
+                raise
+
+    async def save_review(
+        self,
+        file_path: str,
+        review_type: ReviewType,
+        review: AIResponse,
+        metadata: Optional[Dict] = None
+    ) -> str:
+        """Save a review and return its ID."""
+        review_id = str(uuid.uuid4())
+        try:
+            await self._insert_rows([
+                self._review_row(review_id, file_path, review_type, review, metadata)
+            ])
             return review_id
         except Exception as e:
             raise StorageError(f"Failed to save review: {str(e)}")
 
+    async def save_reviews_bulk(
+        self,
+        records: List[Tuple[str, ReviewType, AIResponse, Optional[Dict]]]
+    ) -> List[str]:
+        """Save several reviews in one transaction and return their IDs."""
+        review_ids = [str(uuid.uuid4()) for _ in records]
+        try:
+            await self._insert_rows([
+                self._review_row(review_id, *record)
+                for review_id, record in zip(review_ids, records)
+            ])
+            return review_ids
+        except Exception as e:
+            raise StorageError(f"Failed to save reviews: {str(e)}")
+
     async def get_review(self, review_id: str) -> Optional[ReviewRecord]:
         """Get a review by its ID."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connection() as db:
                 async with db.execute(
-                    "SELECT * FROM reviews WHERE id = ?",
+                    f"SELECT {REVIEW_COLUMNS} FROM reviews WHERE id = ?",
                     (review_id,)
                 ) as cursor:
                     row = await cursor.fetchone()
                     if not row:
                         return None
 
-                    return ReviewRecord(
-                        id=row[0],
-                        file_path=row[1],
-                        review_type=ReviewType(row[2]),
-                        review_response=self._deserialize_review(row[3]),
-                        timestamp=datetime.fromisoformat(row[4]),
-                        metadata=json.loads(row[5]) if row[5] else None
-                    )
+                    return self._record_from_row(row)
         except Exception as e:
             raise StorageError(f"Failed to get review: {str(e)}")
 
@@ -153,31 +330,23 @@ class SQLiteStorage(StorageProvider):
     ) -> List[ReviewRecord]:
         """Get review history for a file."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                query = "SELECT * FROM reviews WHERE file_path = ?"
+            async with self._connection() as db:
+                query = f"SELECT {REVIEW_COLUMNS} FROM reviews WHERE file_path = ?"
                 params = [file_path]
 
                 if review_type:
                     query += " AND review_type = ?"
                     params.append(review_type.value)
 
-                query += " ORDER BY timestamp DESC"
-                if limit:
-                    query += f" LIMIT {limit}"
+                # Bound as a parameter (-1 means no limit) so the SQL text is
+                # the same for every limit and its prepared statement is reused
+                query += " ORDER BY timestamp DESC LIMIT ?"
+                params.append(limit if limit else -1)
 
                 async with db.execute(query, params) as cursor:
-                    rows = await cursor.fetchall()
-                    return [
-                        ReviewRecord(
-                            id=row[0],
-                            file_path=row[1],
-                            review_type=ReviewType(row[2]),
-                            review_response=self._deserialize_review(row[3]),
-                            timestamp=datetime.fromisoformat(row[4]),
-                            metadata=json.loads(row[5]) if row[5] else None
-                        )
-                        for row in rows
-                    ]
+                    # Rows arrive in chunks and are turned into records as
+                    # they come, so the raw rows are never all held at once
+                    return [self._record_from_row(row) async for row in cursor]
         except Exception as e:
             raise StorageError(f"Failed to get file reviews: {str(e)}")
 
@@ -189,9 +358,9 @@ class SQLiteStorage(StorageProvider):
     ) -> List[ReviewRecord]:
         """Get reviews within a timeframe."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                query = "SELECT * FROM reviews WHERE timestamp BETWEEN ? AND ?"
-                params = [start_time.isoformat(), end_time.isoformat()]
+            async with self._connection() as db:
+                query = f"SELECT {REVIEW_COLUMNS} FROM reviews WHERE timestamp BETWEEN ? AND ?"
+                params = [_to_millis(start_time), _to_millis(end_time)]
 
                 if review_type:
                     query += " AND review_type = ?"
@@ -200,25 +369,14 @@ class SQLiteStorage(StorageProvider):
                 query += " ORDER BY timestamp DESC"
 
                 async with db.execute(query, params) as cursor:
-                    rows = await cursor.fetchall()
-                    return [
-                        ReviewRecord(
-                            id=row[0],
-                            file_path=row[1],
-                            review_type=ReviewType(row[2]),
-                            review_response=self._deserialize_review(row[3]),
-                            timestamp=datetime.fromisoformat(row[4]),
-                            metadata=json.loads(row[5]) if row[5] else None
-                        )
-                        for row in rows
-                    ]
+                    return [self._record_from_row(row) async for row in cursor]
         except Exception as e:
             raise StorageError(f"Failed to get reviews in timeframe: {str(e)}")
 
     async def delete_review(self, review_id: str) -> bool:
         """Delete a review by its ID."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connection() as db:
                 cursor = await db.execute(
                     "DELETE FROM reviews WHERE id = ?",
                     (review_id,)
@@ -231,10 +389,10 @@ class SQLiteStorage(StorageProvider):
     async def cleanup_old_reviews(self, older_than: datetime) -> int:
         """Delete reviews older than specified datetime."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connection() as db:
                 cursor = await db.execute(
                     "DELETE FROM reviews WHERE timestamp < ?",
-                    (older_than.isoformat(),)
+                    (_to_millis(older_than),)
                 )
                 await db.commit()
                 return cursor.rowcount
@@ -1,7 +1,7 @@
 import asyncio
 import argparse
 import os
-from typing import Optional
+from typing import Dict, Optional
 
 from ..ai.reviewer import Reviewer
 from ..ai.models.request import ReviewType, ReviewSettings
@@ -9,6 +9,19 @@ from ..ai.providers.factory import ProviderFactory
 from ..ai.github.github_provider import GitHubAPIProvider
 from ..ai.github.reviewer import GitHubReviewer
 
+# One GitHub client per token, so reviewing several PRs in one process
+# reuses its connection pool and cached repository lookups
+_github_providers: Dict[str, GitHubAPIProvider] = {}
+
+
+def _get_github_provider(token: str) -> GitHubAPIProvider:
+    """Get the shared GitHub provider for a token."""
+    github = _github_providers.get(token)
+    if github is None:
+        github = GitHubAPIProvider(token)
+        _github_providers[token] = github
+    return github
+
 
 async def review_pull_request(
     repo: str,
@@ -37,7 +50,7 @@ async def review_pull_request(
         raise ValueError(
             "GitHub token not provided and GITHUB_TOKEN environment variable not set")
 
-    github = GitHubAPIProvider(github_token)
+    github = _get_github_provider(github_token)
 
     # Create GitHub reviewer
     gh_reviewer = GitHubReviewer(
@@ -54,30 +67,32 @@ async def review_pull_request(
         ignore_patterns=None
     )
 
-    try:
-        # Review the pull request
-        print(f"🔍 Reviewing PR #{pr_number} in {repo}...")
-        reviews = await gh_reviewer.review_pull_request(
-            repo,
-            pr_number,
-            review_type=ReviewType(review_type),
-            settings=settings
-        )
-
-        # Submit the review
-        print("📝 Submitting review comments...")
-        await gh_reviewer.submit_review(
-            repo,
-            pr_number,
-            reviews,
-            ReviewType(review_type)
-        )
-
-        print("✅ Review completed successfully!")
-
-    except Exception as e:
-        print(f"❌ Error reviewing pull request: {str(e)}")
-        raise
+    # One storage connection for the whole run, closed on the way out
+    async with reviewer:
+        try:
+            # Review the pull request
+            print(f"🔍 Reviewing PR #{pr_number} in {repo}...")
+            reviews = await gh_reviewer.review_pull_request(
+                repo,
+                pr_number,
+                review_type=ReviewType(review_type),
+                settings=settings
+            )
+
+            # Submit the review
+            print("📝 Submitting review comments...")
+            await gh_reviewer.submit_review(
+                repo,
+                pr_number,
+                reviews,
+                ReviewType(review_type)
+            )
+
+            print("✅ Review completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error reviewing pull request: {str(e)}")
+            raise
 
 
 def main():
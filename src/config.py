@@ -1,7 +1,44 @@
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Pattern, Tuple
+import copy
 import fnmatch
+import functools
+import os
+import re
+
+# libyaml's C loader when PyYAML was built with it; same results, much faster
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+_MISSING = object()
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / 'config' / 'default_config.yml'
+
+
+def _translate(pattern: str) -> str:
+    """Translate a glob to a regex, normalizing case as fnmatch.fnmatch does."""
+    return fnmatch.translate(os.path.normcase(pattern))
+
+
+def _flatten(tree: Dict[str, Any]) -> Dict[str, Any]:
+    """Map every dot-path in a nested dict, subtrees included, to its value."""
+    flat = {}
+    stack = [('', tree)]
+    while stack:
+        prefix, node = stack.pop()
+        for key, value in node.items():
+            path = f"{prefix}{key}"
+            flat[path] = value
+            if isinstance(value, dict):
+                stack.append((f"{path}.", value))
+    return flat
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_default_config() -> Dict[str, Any]:
+    """Parse the default configuration once per process."""
+    with open(DEFAULT_CONFIG_PATH, 'r') as f:
+        return yaml.load(f, Loader=YAML_LOADER)
 
 
 class ConfigManager:
@@ -16,33 +53,62 @@ class ConfigManager:
         self.config = self._load_default_config()
         if custom_config_path:
             self._merge_custom_config(custom_config_path)
+        # Rule lookups by dot-path are single dict probes into this index
+        self._rules = _flatten(self.config['rules'])
+        self._compile_patterns()
 
     def _load_default_config(self) -> Dict[str, Any]:
         """Load default configuration."""
-        default_path = Path(__file__).parent.parent / \
-            'config' / 'default_config.yml'
-        with open(default_path, 'r') as f:
-            return yaml.safe_load(f)
+        # A private copy, since custom configs are merged into it in place
+        return copy.deepcopy(_parse_default_config())
+
+    def _compile_patterns(self) -> None:
+        """Translate the configured globs to regexes once, not per filename."""
+        ignore_patterns = self.get_rule('ignore_patterns', [])
+        # One alternation, so a filename is checked in a single regex match
+        self._ignore_re = re.compile('|'.join(
+            f"(?:{_translate(pattern)})" for pattern in ignore_patterns
+        ) or r'(?!)')
+
+        test_patterns = self.get_rule('test_files.patterns', [
+            "**/test_*.py",
+            "**/tests/*.py",
+            "conftest.py"  # Changed from **/conftest.py
+        ])
+        # Kept per pattern so is_test_file can report which one matched
+        self._test_patterns: List[Tuple[str, Pattern]] = [
+            (pattern, re.compile(_translate(pattern))) for pattern in test_patterns
+        ]
 
     def _merge_custom_config(self, custom_path: str) -> None:
         """Merge custom configuration with defaults."""
         with open(custom_path, 'r') as f:
-            custom_config = yaml.safe_load(f)
+            custom_config = yaml.load(f, Loader=YAML_LOADER)
             self._deep_merge(self.config, custom_config)
 
     def _deep_merge(self, base: Dict, update: Dict) -> None:
         """Deep merge two dictionaries."""
-        for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_merge(base[key], value)
-            else:
-                base[key] = value
+        # An explicit stack of (base, update) pairs instead of recursion
+        stack = [(base, update)]
+        while stack:
+            base, update = stack.pop()
+            for key, value in update.items():
+                current = base.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    base[key] = value
 
     def get_rule(self, rule_path: str, default: Any = None) -> Any:
         """Get rule value from config.
 
         Handles nested rules using dot notation.
         """
+        value = self._rules.get(rule_path, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        # Not a configured path; walk it for the same fallback as before
         parts = rule_path.split('.')
         current = self.config['rules']
 
@@ -55,8 +121,7 @@ class ConfigManager:
 
     def should_ignore_file(self, filename: str) -> bool:
         """Check if file should be ignored based on patterns."""
-        patterns = self.get_rule('ignore_patterns', [])
-        return any(fnmatch.fnmatch(filename, pattern) for pattern in patterns)
+        return self._ignore_re.match(os.path.normcase(filename)) is not None
 
     def is_test_file(self, filename: str) -> bool:
         """Check if file is a test file based on patterns."""
@@ -65,20 +130,16 @@ class ConfigManager:
         # Extract just the filename without path
         base_filename = Path(filename).name
 
-        test_patterns = self.get_rule('test_files.patterns', [
-            "**/test_*.py",
-            "**/tests/*.py",
-            "conftest.py"  # Changed from **/conftest.py
-        ])
-        print(f"Using patterns: {test_patterns}")
+        print(f"Using patterns: {[pattern for pattern, _ in self._test_patterns]}")
 
         # Check base filename first
         if base_filename == "conftest.py":
             return True
 
         # Then check full path patterns
-        for pattern in test_patterns:
-            if fnmatch.fnmatch(filename, pattern):
+        normalized = os.path.normcase(filename)
+        for pattern, regex in self._test_patterns:
+            if regex.match(normalized):
                 print(f"Matched pattern: {pattern}")
                 return True
         return False
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+
+import pytest
+
+try:
+    from src.ai.reviewer import Reviewer, ReviewResult
+except ImportError as e:
+    # src.ai.reviewer pulls in every registered AI provider
+    pytest.skip(f"AI provider modules not importable: {e}", allow_module_level=True)
+
+from src.ai.exceptions import StorageError
+from src.ai.models.response import AIResponse, ReviewComment
+
+
+def _comment(severity: str) -> ReviewComment:
+    return ReviewComment(line_number=1, content="c", severity=severity, category="logic")
+
+
+class StubProvider:
+    """Provider that records how many reviews run at once."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.active = 0
+        self.peak = 0
+
+    async def generate_review(self, request):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if request.code_context.file_path in self.fail:
+                raise RuntimeError("provider down")
+            return AIResponse(comments=[_comment("warning")], summary="ok")
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def reviewer(tmp_path):
+    reviewer = Reviewer(api_key="k", storage_path=str(tmp_path / "reviews.db"))
+    reviewer.provider = StubProvider()
+    return reviewer
+
+
+def test_critical_issues_follow_latest_review_per_file():
+    result = ReviewResult()
+    first = _comment("error")
+    result.add_review("a.py", AIResponse(comments=[first], summary="s"))
+    second = _comment("error")
+    result.add_review("a.py", AIResponse(comments=[second], summary="s"))
+
+    assert result.get_critical_issues() == [("a.py", second)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrent", [0, -1])
+async def test_review_files_rejects_non_positive_concurrency(reviewer, max_concurrent):
+    with pytest.raises(ValueError):
+        await reviewer.review_files({"a.py": "x = 1"}, max_concurrent=max_concurrent)
+
+
+@pytest.mark.asyncio
+async def test_review_files_bounds_concurrency_and_collects_errors(reviewer):
+    reviewer.provider = StubProvider(fail={"bad.py"})
+    files = {f"f{i}.py": "x = 1" for i in range(7)}
+    files["bad.py"] = "x = 1"
+
+    result = await reviewer.review_files(files, max_concurrent=3, store_reviews=False)
+
+    assert reviewer.provider.peak == 3
+    assert result.total_files == 8
+    assert result.successful_reviews == 7
+    assert set(result.reviews) == set(files) - {"bad.py"}
+    assert list(result.errors) == ["bad.py"]
+    assert "provider down" in result.errors["bad.py"]
+    assert result.review_ids == {}
+
+
+@pytest.mark.asyncio
+async def test_review_files_stores_batch_and_maps_review_ids(reviewer):
+    files = {"a.py": "x = 1", "b.py": "y = 2"}
+
+    result = await reviewer.review_files(files, language="python")
+
+    assert set(result.review_ids) == set(files)
+    for file_path, review_id in result.review_ids.items():
+        record = await reviewer.storage.get_review(review_id)
+        assert record.file_path == file_path
+        assert record.metadata == {"language": "python"}
+
+
+@pytest.mark.asyncio
+async def test_review_files_logs_failed_bulk_save(reviewer, monkeypatch, caplog):
+    async def fail(reviews):
+        raise StorageError("disk full")
+
+    monkeypatch.setattr(reviewer.storage, "save_reviews_bulk", fail)
+
+    with caplog.at_level(logging.WARNING, logger="src.ai.reviewer"):
+        result = await reviewer.review_files({"a.py": "x = 1", "b.py": "y = 2"})
+
+    assert result.successful_reviews == 2
+    assert result.review_ids == {}
+    assert "Failed to store reviews: disk full" in caplog.text
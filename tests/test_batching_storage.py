@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from src.ai.exceptions import StorageError
+from src.ai.models.request import ReviewType
+from src.ai.models.response import AIResponse
+from src.ai.storage.batching import BatchingStorage
+from src.ai.storage.sqlite import SQLiteStorage
+
+
+def _review(summary="ok"):
+    return AIResponse(comments=[], summary=summary)
+
+
+@pytest_asyncio.fixture
+async def sqlite_storage(tmp_path):
+    """SQLite storage in a temporary database, closed after the test."""
+    storage = SQLiteStorage(str(tmp_path / "reviews.db"))
+    yield storage
+    await storage.close()
+
+
+async def _stored_count(storage, file_path):
+    return len(await storage.get_file_reviews(file_path))
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_is_full(sqlite_storage):
+    """Test that reaching batch_size writes the queued rows."""
+    batching = BatchingStorage(sqlite_storage, batch_size=3, flush_interval=60)
+    for _ in range(2):
+        await batching.save_review("a.py", ReviewType.FULL, _review())
+    assert await _stored_count(sqlite_storage, "a.py") == 0
+
+    await batching.save_review("a.py", ReviewType.FULL, _review())
+    assert await _stored_count(sqlite_storage, "a.py") == 3
+
+
+@pytest.mark.asyncio
+async def test_flushes_after_interval(sqlite_storage):
+    """Test that a partial batch is written once flush_interval passes."""
+    batching = BatchingStorage(sqlite_storage, batch_size=50, flush_interval=0.01)
+    await batching.save_review("a.py", ReviewType.FULL, _review())
+    assert await _stored_count(sqlite_storage, "a.py") == 0
+
+    await asyncio.sleep(0.05)
+    assert await _stored_count(sqlite_storage, "a.py") == 1
+
+
+@pytest.mark.asyncio
+async def test_reads_flush_first(sqlite_storage):
+    """Test that a queued review is visible through the wrapper's reads."""
+    batching = BatchingStorage(sqlite_storage, batch_size=50, flush_interval=60)
+    review_id = await batching.save_review("a.py", ReviewType.FULL, _review("queued"))
+
+    record = await batching.get_review(review_id)
+    assert record.review_response.summary == "queued"
+    assert len(await batching.get_file_reviews("a.py")) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_rows_queued(sqlite_storage, monkeypatch):
+    """Test that rows survive a failed write and are saved by a later flush."""
+    batching = BatchingStorage(sqlite_storage, batch_size=50, flush_interval=60)
+    review_id = await batching.save_review("a.py", ReviewType.FULL, _review())
+
+    insert_rows = sqlite_storage._insert_rows
+
+    async def failing_insert(rows):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(sqlite_storage, "_insert_rows", failing_insert)
+    with pytest.raises(StorageError):
+        await batching.flush()
+
+    monkeypatch.setattr(sqlite_storage, "_insert_rows", insert_rows)
+    await batching.close()
+    assert (await sqlite_storage.get_review(review_id)) is not None
@@ -31,3 +31,19 @@ def test_custom_config(test_config_file):
     assert config.get_rule('complexity.max_nested_blocks') == 4
     # Default values should still be present
     assert config.get_rule('required_docstrings') is True
+
+
+def test_custom_config_does_not_leak_into_defaults(test_config_file):
+    """Test that merging a custom config leaves later instances' defaults intact."""
+    ConfigManager(test_config_file)
+    config = ConfigManager()
+    assert config.get_rule('max_line_length') == 100
+    assert config.get_rule('complexity.max_nested_blocks') == 3
+
+
+def test_should_ignore_file():
+    """Test matching filenames against the configured ignore patterns."""
+    config = ConfigManager()
+    assert config.should_ignore_file('src/tests/helpers.py')
+    assert config.should_ignore_file('pkg/test_module.py')
+    assert not config.should_ignore_file('src/module.py')
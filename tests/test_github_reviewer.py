@@ -0,0 +1,82 @@
+import pytest
+
+try:
+    from src.ai.github.reviewer import split_diff_by_file
+except ImportError as e:
+    # src.ai.github pulls in the reviewer and every registered AI provider
+    pytest.skip(f"AI provider modules not importable: {e}", allow_module_level=True)
+
+PLAIN = """diff --git a/app.py b/app.py
+index 83db48f..bf269f4 100644
+--- a/app.py
++++ b/app.py
+@@ -1,2 +1,2 @@
+-x = 1
++x = 2
+ y = 3
+"""
+
+NEW_FILE = """diff --git a/new.py b/new.py
+new file mode 100644
+index 0000000..e69de29
+--- /dev/null
++++ b/new.py
+@@ -0,0 +1 @@
++print('hi')
+"""
+
+DELETED = """diff --git a/old.py b/old.py
+deleted file mode 100644
+index e69de29..0000000
+--- a/old.py
++++ /dev/null
+@@ -1 +0,0 @@
+-print('bye')
+"""
+
+RENAMED = """diff --git a/before.py b/after.py
+similarity index 90%
+rename from before.py
+rename to after.py
+index 83db48f..bf269f4 100644
+--- a/before.py
++++ b/after.py
+@@ -1 +1 @@
+-x = 1
++x = 2
+"""
+
+MODE_CHANGE = """diff --git a/run.sh b/run.sh
+old mode 100644
+new mode 100755
+"""
+
+BINARY = """diff --git a/logo.png b/logo.png
+index 83db48f..bf269f4 100644
+Binary files a/logo.png and b/logo.png differ
+"""
+
+
+def test_split_diff_by_file_single_cases():
+    """Test that each kind of file section is keyed by its path."""
+    cases = {
+        "app.py": PLAIN,
+        "new.py": NEW_FILE,
+        "old.py": DELETED,
+        "after.py": RENAMED,
+        "run.sh": MODE_CHANGE,
+        "logo.png": BINARY,
+    }
+    for path, section in cases.items():
+        assert split_diff_by_file(section) == {path: section}
+
+
+def test_split_diff_by_file_keeps_every_file():
+    """Test that a combined diff is split into one section per file."""
+    sections = [PLAIN, NEW_FILE, DELETED, RENAMED, MODE_CHANGE, BINARY]
+    per_file = split_diff_by_file("".join(sections))
+
+    assert list(per_file) == [
+        "app.py", "new.py", "old.py", "after.py", "run.sh", "logo.png"]
+    assert per_file["after.py"] == RENAMED.rstrip("\n")
+    assert per_file["logo.png"] == BINARY
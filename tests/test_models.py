@@ -0,0 +1,26 @@
+from src.ai.models.response import AIResponse, ReviewComment
+
+
+def _comment(severity: str) -> ReviewComment:
+    return ReviewComment(line_number=1, content="c", severity=severity, category="logic")
+
+
+def test_comments_by_severity_reflects_appended_comments():
+    response = AIResponse(comments=[_comment("warning")], summary="s")
+    assert response.get_comments_by_severity("error") == []
+
+    error = _comment("error")
+    response.comments.append(error)
+
+    assert response.has_critical_issues
+    assert response.get_comments_by_severity("error") == [error]
+
+
+def test_severity_counts_is_a_fresh_count():
+    response = AIResponse(comments=[_comment("warning")], summary="s")
+    counts = response.severity_counts
+    counts["error"] += 1
+    assert response.severity_counts["error"] == 0
+
+    response.comments.append(_comment("error"))
+    assert response.severity_counts == {"warning": 1, "error": 1}
@@ -0,0 +1,26 @@
+import io
+
+from src.ai.reporting.base import ReportSection, ReviewReport
+
+
+def test_render_to_writes_sections_in_order():
+    report = ReviewReport(
+        title="Review",
+        summary="s",
+        sections=[
+            ReportSection(title="Overview", content="## Summary\nAll good\n"),
+            ReportSection(title="Errors", content="## Errors\nNone"),
+        ],
+    )
+    out = io.StringIO()
+
+    report.render_to(out)
+
+    # Titles are not written; a newline is added only where content lacks one
+    assert out.getvalue() == "## Summary\nAll good\n\n## Errors\nNone\n"
+
+
+def test_render_to_empty_report_writes_nothing():
+    out = io.StringIO()
+    ReviewReport(title="Review", summary="s", sections=[]).render_to(out)
+    assert out.getvalue() == ""
@@ -0,0 +1,35 @@
+import datetime
+
+import pytest
+from src.ai.config.settings import _load_yaml_with_sidecar
+
+
+def _config_files(tmp_path):
+    return sorted(p.name for p in tmp_path.iterdir())
+
+
+def test_sidecar_round_trip(tmp_path):
+    """Test that JSON-safe config is cached in a sidecar and read back intact."""
+    config_file = tmp_path / "c.yml"
+    config_file.write_text("rules:\n  max_line_length: 120\n")
+
+    first = _load_yaml_with_sidecar(str(config_file))
+    files = _config_files(tmp_path)
+    assert len(files) == 2
+    assert files[1].endswith(".cache.json")
+
+    assert _load_yaml_with_sidecar(str(config_file)) == first
+
+
+@pytest.mark.parametrize("content, expected", [
+    ("rules:\n  1: a\n", {"rules": {1: "a"}}),
+    ("released: 2024-01-02\n", {"released": datetime.date(2024, 1, 2)}),
+])
+def test_sidecar_skipped_for_non_json_data(tmp_path, content, expected):
+    """Test that data JSON can't reproduce is never cached or left behind."""
+    config_file = tmp_path / "c.yml"
+    config_file.write_text(content)
+
+    assert _load_yaml_with_sidecar(str(config_file)) == expected
+    assert _load_yaml_with_sidecar(str(config_file)) == expected
+    assert _config_files(tmp_path) == ["c.yml"]
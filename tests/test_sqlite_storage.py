@@ -0,0 +1,160 @@
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from src.ai.models.request import ReviewType
+from src.ai.models.response import AIResponse, ReviewComment
+from src.ai.storage.sqlite import SQLiteStorage
+
+FIRST = datetime(2024, 3, 5, 12, 0, 0)
+SECOND = datetime(2024, 3, 6, 12, 0, 0, 500000)
+
+
+def _review(summary="ok"):
+    return AIResponse(
+        comments=[ReviewComment(1, "Unused import", "warning", "style")],
+        summary=summary,
+        score=0.8
+    )
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    """A version-0 database with ISO-8601 text timestamps."""
+    db_path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE reviews (
+            id TEXT PRIMARY KEY,
+            file_path TEXT NOT NULL,
+            review_type TEXT NOT NULL,
+            review_response TEXT NOT NULL,
+            timestamp DATETIME NOT NULL,
+            metadata TEXT
+        )
+    """)
+    payload = '{"comments": [], "summary": "old", "score": null, "metadata": {}}'
+    conn.executemany(
+        "INSERT INTO reviews VALUES (?, ?, 'full', ?, ?, NULL)",
+        [
+            ("first", "a.py", payload, FIRST.isoformat()),
+            ("second", "a.py", payload, SECOND.isoformat()),
+        ]
+    )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+@pytest_asyncio.fixture
+async def storage(tmp_path):
+    """SQLite storage in a fresh temporary database, closed after the test."""
+    storage = SQLiteStorage(str(tmp_path / "reviews.db"))
+    yield storage
+    await storage.close()
+
+
+def test_migration_converts_text_timestamps(legacy_db):
+    """Test that version-0 text timestamps become epoch milliseconds."""
+    SQLiteStorage(legacy_db)
+
+    conn = sqlite3.connect(legacy_db)
+    rows = conn.execute(
+        "SELECT id, typeof(timestamp), timestamp FROM reviews ORDER BY id"
+    ).fetchall()
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    conn.close()
+
+    assert rows == [
+        ("first", "integer", 1709640000000),
+        ("second", "integer", 1709726400500),
+    ]
+    assert version == SQLiteStorage.SCHEMA_VERSION
+
+
+@pytest.mark.asyncio
+async def test_migrated_timeframe_and_cleanup_boundaries(legacy_db):
+    """Test range queries and cleanup against migrated rows at their edges."""
+    storage = SQLiteStorage(legacy_db)
+    try:
+        record = await storage.get_review("second")
+        assert record.timestamp == SECOND
+
+        # BETWEEN includes both ends
+        in_range = await storage.get_reviews_in_timeframe(FIRST, SECOND)
+        assert [r.id for r in in_range] == ["second", "first"]
+        later = await storage.get_reviews_in_timeframe(
+            FIRST + timedelta(milliseconds=1), SECOND)
+        assert [r.id for r in later] == ["second"]
+
+        # Cleanup only removes reviews strictly older than the cutoff
+        assert await storage.cleanup_old_reviews(FIRST) == 0
+        assert await storage.cleanup_old_reviews(SECOND) == 1
+        assert await storage.get_review("first") is None
+        assert await storage.get_review("second") is not None
+    finally:
+        await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_save_reviews_bulk(storage):
+    """Test saving several reviews at once and reading them back by ID."""
+    review_ids = await storage.save_reviews_bulk([
+        ("a.py", ReviewType.FULL, _review("first"), {"language": "python"}),
+        ("b.py", ReviewType.SECURITY, _review("second"), None),
+    ])
+
+    assert len(set(review_ids)) == 2
+    first = await storage.get_review(review_ids[0])
+    second = await storage.get_review(review_ids[1])
+    assert (first.file_path, first.review_response.summary) == ("a.py", "first")
+    assert first.metadata == {"language": "python"}
+    assert first.review_response.comments == _review().comments
+    assert (second.review_type, second.metadata) == (ReviewType.SECURITY, {})
+
+
+@pytest.mark.asyncio
+async def test_get_file_reviews_limit(storage):
+    """Test that the history limit is applied, and that no limit returns all."""
+    await storage.save_reviews_bulk(
+        [("a.py", ReviewType.FULL, _review(), None)] * 3
+        + [("a.py", ReviewType.SECURITY, _review(), None)]
+    )
+
+    assert len(await storage.get_file_reviews("a.py")) == 4
+    assert len(await storage.get_file_reviews("a.py", limit=2)) == 2
+    assert len(await storage.get_file_reviews(
+        "a.py", limit=2, review_type=ReviewType.SECURITY)) == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_connection_scope(storage):
+    """Test that queries in an async with block share one connection."""
+    async with storage:
+        shared = storage._db
+        assert shared is not None
+        review_id = await storage.save_review("a.py", ReviewType.FULL, _review())
+        assert await storage.get_review(review_id) is not None
+        assert storage._db is shared
+    assert storage._db is None
+    assert await storage.get_review(review_id) is not None
+
+
+def test_unclosed_storage_does_not_block_exit(tmp_path):
+    """Test that a process using storage without close() still exits."""
+    script = (
+        "import asyncio\n"
+        "from src.ai.storage.sqlite import SQLiteStorage\n"
+        f"storage = SQLiteStorage({str(tmp_path / 'reviews.db')!r})\n"
+        "asyncio.run(storage.get_review('missing'))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parent.parent,
+        timeout=30
+    )
+    assert result.returncode == 0